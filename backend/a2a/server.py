@@ -65,14 +65,13 @@ def _get_bot_from_request(request: Request) -> dict:
     return result
 
 
-def _get_engine():
-    from main import game_engine
-    return game_engine
+def _get_engine(request: Request):
+    """Get the game engine published on app.state at startup (None before startup)."""
+    return getattr(request.app.state, "game_engine", None)
 
 
-async def _process_task(message: str, bot_data: dict) -> str:
+async def _process_task(message: str, bot_data: dict, engine) -> str:
     """Process an A2A task message and return a response."""
-    engine = _get_engine()
     if not engine:
         return "The casino is currently offline. Please try again later."
 
@@ -255,7 +254,7 @@ async def handle_a2a_task(request: Request):
         message = "help"
 
     # Process the task
-    response_text = await _process_task(message, bot_data)
+    response_text = await _process_task(message, bot_data, _get_engine(request))
 
     # Return A2A task response format
     return {
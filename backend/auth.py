@@ -14,11 +14,10 @@ from fastapi import HTTPException, Depends
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from jose import JWTError, jwt
 
-from settings import settings
+from settings import get_settings
 
 SECRET_KEY = None
 ALGORITHM = "HS256"
-ACCESS_TOKEN_EXPIRE_MINUTES = settings.auth_access_token_expires * 60
 
 security = HTTPBearer()
 
@@ -31,7 +30,7 @@ def load_secret_key(secret: str = None):
     if secret:
         SECRET_KEY = secret
     else:
-        SECRET_KEY = settings.auth_jwt_secret
+        SECRET_KEY = get_settings().auth_jwt_secret
 
 
 def generate_token(data: Dict, expires_delta: timedelta | None = None) -> Tuple[str, datetime]:
@@ -42,7 +41,7 @@ def generate_token(data: Dict, expires_delta: timedelta | None = None) -> Tuple[
     if expires_delta:
         expire = datetime.now(timezone.utc) + expires_delta
     else:
-        expire = datetime.now(timezone.utc) + timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
+        expire = datetime.now(timezone.utc) + timedelta(hours=get_settings().auth_access_token_expires)
     to_encode.update({"exp": expire})
     encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
     return (encoded_jwt, expire)
@@ -113,7 +112,3 @@ async def get_current_bot(
     if not result:
         raise HTTPException(status_code=401, detail="Invalid API token")
     return result
-
-
-# Initialize secret key on module load
-load_secret_key()
@@ -0,0 +1,20 @@
+from typing import Any
+
+from fastapi import Response
+from pydantic_core import to_json
+
+
+class JSONBytesResponse(Response):
+    """Response whose body is already-encoded JSON bytes."""
+    media_type = "application/json"
+
+
+def json_response(content: Any, status_code: int = 200, **kwargs) -> Response:
+    """
+    Serialize content straight to JSON bytes with pydantic-core.
+
+    Handles Pydantic models, dicts, lists, datetimes and enums in a single pass,
+    skipping FastAPI's jsonable_encoder + json.dumps round trip.
+    Extra kwargs (e.g. exclude) are passed to pydantic_core.to_json.
+    """
+    return JSONBytesResponse(content=to_json(content, **kwargs), status_code=status_code)
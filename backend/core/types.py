@@ -109,6 +109,11 @@ class BotProfile(BaseModel):
     losses: int = 0
 
 
+# BotProfile fields never returned to clients. Not marked exclude=True on the
+# model because model_dump() is also used to persist bots to the database.
+BOT_PRIVATE_FIELDS = {"api_token_hash"}
+
+
 class BetType(str, Enum):
     STRAIGHT = "straight"
     RED = "red"
@@ -125,6 +130,21 @@ class PlaceBetRequest(BaseModel):
     bet_type: BetType
     bet_value: Optional[int] = None  # For straight bets: the number (0-36)
     amount: int = Field(ge=1, description="Bet amount in BotChips")
+    chat: Optional[str] = Field(default=None, max_length=200, description="Optional chat message posted with the bet")
+
+
+class BatchBetItem(PlaceBetRequest):
+    """One bot's bet inside a batch, authenticated by that bot's API token."""
+    token: str = Field(min_length=1, description="API token of the bot placing this bet")
+
+
+# Most bets accepted in one /bet_batch request (test-bot/bot.py splits larger batches)
+BET_BATCH_MAX_BETS = 100
+
+
+class PlaceBetBatchRequest(BaseModel):
+    """Bets from several bots, placed with a single request."""
+    bets: List[BatchBetItem] = Field(min_length=1, max_length=BET_BATCH_MAX_BETS)
 
 
 class BetRecord(BaseModel):
@@ -160,6 +180,10 @@ class TablePhase(str, Enum):
     PAUSE = "pause"
 
 
+# Positional phase codes for compact status responses, in declaration order
+TABLE_PHASE_CODES = {phase: code for code, phase in enumerate(TablePhase)}
+
+
 class TableStatus(BaseModel):
     """Current status of a roulette table."""
     table_id: str = "main"
@@ -5,7 +5,7 @@ from typing import Optional
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
-from settings import settings
+from settings import get_settings
 from core.rqid_in_logs import AddRequestID
 import os
 from logging.handlers import RotatingFileHandler
@@ -15,15 +15,16 @@ from modules.game_engine import GameEngine
 from modules.ws_manager import WebSocketManager
 
 # Configure file logging if enabled
-if settings.log_file:
-    log_dir = os.path.dirname(settings.log_file)
+log_file = get_settings().log_file
+if log_file:
+    log_dir = os.path.dirname(log_file)
     if log_dir:
         os.makedirs(log_dir, exist_ok=True)
 
     log_format = "[%(asctime)s] %(levelname)s [Req-ID: %(request_id)s]: %(message)s"
 
     file_handler = RotatingFileHandler(
-        settings.log_file, maxBytes=5_000_000, backupCount=5
+        log_file, maxBytes=5_000_000, backupCount=5
     )
     file_handler.setFormatter(Formatter(log_format))
     file_handler.addFilter(AddRequestID())
@@ -31,7 +32,7 @@ if settings.log_file:
     root_logger = logging.getLogger()
 
     handler_exists = any(
-        isinstance(h, RotatingFileHandler) and h.baseFilename == os.path.abspath(settings.log_file)
+        isinstance(h, RotatingFileHandler) and h.baseFilename == os.path.abspath(log_file)
         for h in root_logger.handlers
     )
 
@@ -53,7 +54,7 @@ logging.getLogger("watchfiles.main").setLevel(logging.WARNING)
 VERSION = "0.2.0"
 
 # Global game engine and WebSocket manager instances
-# These are accessed by routers via: from main import game_engine, ws_manager
+# Also published on app.state at startup for dependency injection in routers
 game_engine: Optional[GameEngine] = None
 ws_manager: Optional[WebSocketManager] = None
 
@@ -61,6 +62,8 @@ ws_manager: Optional[WebSocketManager] = None
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Initialize application on startup, cleanup on shutdown."""
+    settings = get_settings()
+
     # Initialize database
     from modules.db import initialize as init_db
     init_db()
@@ -84,6 +87,10 @@ async def lifespan(app: FastAPI):
     ws_manager = WebSocketManager()
     game_engine = GameEngine(ws_manager=ws_manager)
 
+    # Expose instances to routers via request.app.state (see routers/games.py)
+    app.state.ws_manager = ws_manager
+    app.state.game_engine = game_engine
+
     # Start game engine as background task
     engine_task = asyncio.create_task(game_engine.run())
     logging.info("Game engine started as background task")
@@ -114,7 +121,7 @@ app = FastAPI(
 )
 
 # CORS
-allowed_origins = settings.cors_allowed_origins if settings.cors_allowed_origins else ["*"]
+allowed_origins = get_settings().cors_allowed_origins or ["*"]
 app.add_middleware(
     CORSMiddleware,
     allow_origins=allowed_origins,
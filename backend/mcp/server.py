@@ -3,6 +3,7 @@ MCP (Model Context Protocol) server for AI Bot Casino.
 Provides tools for AI agents to play roulette.
 """
 import logging
+import sys
 from mcp.server.fastmcp import FastMCP
 
 logger = logging.getLogger(__name__)
@@ -19,8 +20,11 @@ mcp_server = FastMCP(
 
 
 def _get_engine():
-    from main import game_engine
-    return game_engine
+    # MCP tools run in the mounted MCP sub-app, so the main app's state is not
+    # reachable from the request; read the global directly from the loaded module
+    # instead of re-running the import machinery on every call.
+    main_module = sys.modules.get("main")
+    return getattr(main_module, "game_engine", None)
 
 
 def _get_bot_from_context(ctx) -> dict:
@@ -173,16 +177,13 @@ async def place_bet(ctx, bet_type: str, amount: int, bet_value: int = None) -> s
 
         # Broadcast to spectators
         if engine.ws_manager:
-            await engine.ws_manager.broadcast({
-                "type": "new_bet",
-                "bet": {
-                    "bot_id": bot_id,
-                    "bot_name": name,
-                    "bet_type": bet_type,
-                    "bet_value": bet_value,
-                    "amount": amount,
-                },
-            })
+            engine.ws_manager.broadcast_bet({
+                "bot_id": bot_id,
+                "bot_name": name,
+                "bet_type": bet_type,
+                "bet_value": bet_value,
+                "amount": amount,
+            }, engine.table.table_id)
 
         return f"Bet placed: {amount} BotChips on {bet_type}" + (f" ({bet_value})" if bet_value is not None else "")
     except Exception as e:
@@ -196,9 +197,11 @@ async def get_balance(ctx) -> str:
     bot = bot_data["bot"]
 
     import json
-    data = bot.model_dump() if hasattr(bot, 'model_dump') else dict(bot)
-    # Remove sensitive hash
-    data.pop("api_token_hash", None)
+    from core.types import BOT_PRIVATE_FIELDS
+    if hasattr(bot, 'model_dump'):
+        data = bot.model_dump(exclude=BOT_PRIVATE_FIELDS)
+    else:
+        data = {k: v for k, v in bot.items() if k not in BOT_PRIVATE_FIELDS}
     return json.dumps(data, indent=2, default=str)
 
 
@@ -10,7 +10,7 @@ import uuid
 
 from fastapi import HTTPException, Request
 
-from settings import settings
+from settings import get_settings
 from auth import generate_token, hash_api_token
 from core.types import (
     generate_id, RegisterUserRequest, LoginUserRequest,
@@ -31,6 +31,7 @@ def _is_test_email(email: str) -> bool:
 
 def _get_otp_code(email: str) -> str:
     """Get OTP code - fixed for test users, random for real users."""
+    settings = get_settings()
     if _is_test_email(email):
         return settings.test_users_otp
     return str(random.randint(100000, 999999))
@@ -39,6 +40,7 @@ def _get_otp_code(email: str) -> str:
 def register_user(req: RegisterUserRequest, fastapi_request: Request,
                   candidate_users, users, otps) -> RegisterOrLoginResponse:
     """Register a new user — creates candidate user + OTP + sends email."""
+    settings = get_settings()
 
     def create_policy_history(fastapi_request: Request) -> Acceptance:
         return Acceptance(
@@ -125,6 +127,7 @@ def register_user(req: RegisterUserRequest, fastapi_request: Request,
 
 def login_user(req: LoginUserRequest, users, otps) -> RegisterOrLoginResponse:
     """Login an existing user — sends OTP to their email."""
+    settings = get_settings()
 
     user_email = req.email.strip().lower()
 
@@ -185,6 +188,7 @@ def login_user(req: LoginUserRequest, users, otps) -> RegisterOrLoginResponse:
 
 def verify_otp(req: VerifyOTPRequest, candidate_users, users, otps) -> VerifyOTPResponse:
     """Verify the OTP code. On registration, moves candidate→user."""
+    settings = get_settings()
     try:
         otp = otps[req.otp_id]
     except KeyError:
@@ -239,6 +243,7 @@ def verify_otp(req: VerifyOTPRequest, candidate_users, users, otps) -> VerifyOTP
 
 def verify_magic_link(req: VerifyMagicLinkRequest, candidate_users, users, otps) -> VerifyOTPResponse:
     """Verify the magic link token — no reCAPTCHA required."""
+    settings = get_settings()
     try:
         otp = otps[req.otp_id]
     except KeyError:
@@ -299,6 +304,7 @@ def verify_magic_link(req: VerifyMagicLinkRequest, candidate_users, users, otps)
 
 def setup_bot(user_id: str, req: SetupBotRequest, users, bots) -> SetupBotResponse:
     """Create a bot profile for the user. Called after registration (step 2)."""
+    settings = get_settings()
     user = users.get(user_id)
     if user is None:
         raise HTTPException(status_code=404, detail="User not found")
@@ -338,6 +344,7 @@ def setup_bot(user_id: str, req: SetupBotRequest, users, bots) -> SetupBotRespon
 
 def regenerate_bot_token(user_id: str, users, bots) -> SetupBotResponse:
     """Regenerate the API token for the user's bot, invalidating the old one."""
+    settings = get_settings()
     user = users.get(user_id)
     if user is None:
         raise HTTPException(status_code=404, detail="User not found")
@@ -3,7 +3,7 @@ import logging
 from datetime import datetime, timezone, timedelta
 from typing import Optional, Dict, List
 
-from settings import settings
+from settings import get_settings
 from modules.db import get_db_handle_bots, get_db_handle_rounds
 from core.types import BotProfile, LeaderboardEntry
 from core.exceptions import RefillCooldownError
@@ -27,6 +27,7 @@ def request_refill(bot_id: str) -> BotProfile:
     Request a BotChips refill.
     Requirements: balance must be 0, and cooldown (24h) must have elapsed.
     """
+    settings = get_settings()
     bots_db = get_db_handle_bots()
     bot = bots_db[bot_id]
     if isinstance(bot, dict):
@@ -2,7 +2,7 @@
 Database handles for Firestore collections (production) or in-memory storage (mock mode).
 Provides dependency injection for routers.
 """
-from settings import settings
+from settings import get_settings
 from core.types import UserInfo, BotProfile, OTP, RoundResult
 import logging
 
@@ -132,6 +132,7 @@ def get_db_handle_rounds():
 def initialize():
     """Initialize all database connections (Firestore or in-memory based on mock_mode)"""
     global users_data, candidate_users_data, bots_data, otps_data, rounds_data
+    settings = get_settings()
 
     if settings.mock_mode:
         _initialize_mock_storage()
@@ -157,6 +158,7 @@ def _initialize_mock_storage():
 def _initialize_firestore():
     """Initialize Firestore connections for production"""
     global users_data, candidate_users_data, bots_data, otps_data, rounds_data
+    settings = get_settings()
 
     from core.firestore_dict import FirestoreDict
 
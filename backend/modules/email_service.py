@@ -5,7 +5,7 @@ Uses MailerSend for transactional emails with dry-run support.
 from abc import ABC, abstractmethod
 from pydantic import BaseModel
 from typing import Optional, List, Dict
-from settings import settings
+from settings import get_settings
 from enum import Enum
 import logging
 
@@ -34,12 +34,14 @@ class MailerSendService(EmailService):
     """MailerSend email implementation (v2 SDK)."""
 
     def __init__(self):
+        settings = get_settings()
         from mailersend import MailerSendClient
         self.client = MailerSendClient(api_key=settings.email_mailersend_api_key)
         self.from_email = settings.email_from_address or "noreply@aibotcasino.com"
 
     def send_email(self, recipient_list: List[EmailRecipient], email_type: EmailType,
                    attributes: Dict = {}):
+        settings = get_settings()
         from mailersend import EmailBuilder
 
         template_id = settings.email_mailersend_templates.get(email_type.value)
@@ -92,6 +94,7 @@ _mailer: Optional[EmailService] = None
 def send_email(recipient_list: List[EmailRecipient], email_type: EmailType,
                attributes: Dict = {}):
     """Send an email using the configured mailer."""
+    settings = get_settings()
     global _mailer
     if _mailer is None:
         if settings.email_mailer_dry_run or not settings.email_mailer:
@@ -13,9 +13,9 @@ import logging
 import secrets
 import time
 from datetime import datetime, timezone
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
-from settings import settings
+from settings import get_settings
 from core.types import (
     BetType,
     BetRecord,
@@ -51,6 +51,10 @@ def _get_attr(obj, key, default=None):
 RED_NUMBERS = {1, 3, 5, 7, 9, 12, 14, 16, 18, 19, 21, 23, 25, 27, 30, 32, 34, 36}
 BLACK_NUMBERS = {2, 4, 6, 8, 10, 11, 13, 15, 17, 20, 22, 24, 26, 28, 29, 31, 33, 35}
 
+# Leaderboard entries are reused until the next settlement, or at most this long
+# (refills and new registrations change balances outside the engine)
+LEADERBOARD_CACHE_TTL_SECONDS = 2.0
+
 PAYOUT_MAP = {
     BetType.STRAIGHT: 35,
     BetType.RED: 1,
@@ -77,10 +81,22 @@ class Table:
         self.last_bet_times: Dict[str, float] = {}  # bot_id -> last bet timestamp
         self.total_rounds_today = 0
         self.total_wagered_today = 0
+        self.state_version = 0  # bumped on every change visible in get_status()
         logger.info(f"Table {table_id} initialized")
 
+    def touch(self) -> None:
+        """Mark table state as changed (invalidates cached status snapshots)."""
+        self.state_version += 1
+
+    def start_phase(self, phase: TablePhase) -> None:
+        """Enter a new phase and restart the phase timer."""
+        self.phase = phase
+        self.phase_start_time = time.time()
+        self.touch()
+
     def join(self, bot_id: str, name: str, avatar_seed: str, avatar_style: str) -> None:
         """Add bot to table."""
+        settings = get_settings()
         if len(self.seated_bots) >= settings.table_max_bots:
             logger.warning(f"Bot {bot_id} tried to join full table {self.table_id}")
             raise TableFullError(self.table_id, settings.table_max_bots)
@@ -92,15 +108,18 @@ class Table:
             "avatar_style": avatar_style,
             "joined_at": time.time(),
         }
+        self.touch()
         logger.info(f"Bot {bot_id} ({name}) joined table {self.table_id}. Seated: {len(self.seated_bots)}/{settings.table_max_bots}")
 
     def leave(self, bot_id: str) -> None:
         """Remove bot from table."""
+        settings = get_settings()
         if bot_id in self.seated_bots:
             bot_name = self.seated_bots[bot_id]["name"]
             del self.seated_bots[bot_id]
             if bot_id in self.last_bet_times:
                 del self.last_bet_times[bot_id]
+            self.touch()
             logger.info(f"Bot {bot_id} ({bot_name}) left table {self.table_id}. Seated: {len(self.seated_bots)}/{settings.table_max_bots}")
 
     def is_seated(self, bot_id: str) -> bool:
@@ -127,6 +146,7 @@ class Table:
             InsufficientBalanceError: If bot lacks funds
             ValueError: If bet parameters are invalid
         """
+        settings = get_settings()
         # Validate phase
         if self.phase != TablePhase.BETTING:
             logger.warning(f"Bot {bot_id} tried to bet during {self.phase} phase")
@@ -179,6 +199,7 @@ class Table:
 
         self.current_bets.append(bet_record)
         self.last_bet_times[bot_id] = current_time
+        self.touch()
 
         logger.info(
             f"Bot {bot_id} placed bet: {bet_type.value}"
@@ -190,6 +211,7 @@ class Table:
 
     def get_time_remaining(self) -> float:
         """Calculate time remaining in current phase."""
+        settings = get_settings()
         if self.phase == TablePhase.IDLE:
             return 0.0
 
@@ -207,6 +229,7 @@ class Table:
 
     def get_status(self) -> TableStatus:
         """Build current table status."""
+        settings = get_settings()
         seated_bots_list = list(self.seated_bots.values())
 
         return TableStatus(
@@ -230,12 +253,15 @@ class GameEngine:
     def __init__(self, ws_manager=None):
         self.table = Table()
         self.ws_manager = ws_manager
+        self.leaderboard_version = 0  # bumped whenever settlement changes bot balances
+        self._leaderboard_cache: Optional[Tuple[int, int, float, List[LeaderboardEntry]]] = None  # (version, limit, built_at, entries)
         self._running = False
         self._task = None
         logger.info("GameEngine initialized")
 
     async def run(self) -> None:
         """Main game loop managing all phases of the roulette game."""
+        settings = get_settings()
         self._running = True
         logger.info("GameEngine starting main loop")
 
@@ -245,6 +271,7 @@ class GameEngine:
                 while len(self.table.seated_bots) == 0 and self._running:
                     if self.table.phase != TablePhase.IDLE:
                         self.table.phase = TablePhase.IDLE
+                        self.table.touch()
                         logger.info("Table entering IDLE phase (no bots seated)")
                     await asyncio.sleep(1)
 
@@ -252,8 +279,7 @@ class GameEngine:
                     break
 
                 # BETTING phase
-                self.table.phase = TablePhase.BETTING
-                self.table.phase_start_time = time.time()
+                self.table.start_phase(TablePhase.BETTING)
                 self.table.current_bets = []
                 self.table.round_number += 1
                 logger.info(f"Round {self.table.round_number} BETTING phase started ({settings.table_betting_duration}s)")
@@ -264,8 +290,7 @@ class GameEngine:
                     break
 
                 # SPINNING phase
-                self.table.phase = TablePhase.SPINNING
-                self.table.phase_start_time = time.time()
+                self.table.start_phase(TablePhase.SPINNING)
                 result_number = secrets.randbelow(37)
                 result_color = "green" if result_number == 0 else ("red" if result_number in RED_NUMBERS else "black")
                 logger.info(
@@ -279,8 +304,7 @@ class GameEngine:
                     break
 
                 # SETTLEMENT phase
-                self.table.phase = TablePhase.SETTLEMENT
-                self.table.phase_start_time = time.time()
+                self.table.start_phase(TablePhase.SETTLEMENT)
                 logger.info(f"Round {self.table.round_number} SETTLEMENT phase started")
                 round_result = await self.settle_round(result_number, result_color)
                 await self.broadcast_settlement(round_result)
@@ -290,8 +314,7 @@ class GameEngine:
                     break
 
                 # PAUSE phase
-                self.table.phase = TablePhase.PAUSE
-                self.table.phase_start_time = time.time()
+                self.table.start_phase(TablePhase.PAUSE)
                 logger.info(f"Round {self.table.round_number} PAUSE phase started")
                 await self.broadcast_phase_change("pause")
                 await asyncio.sleep(settings.table_pause_duration)
@@ -387,6 +410,8 @@ class GameEngine:
         self.table.last_result = round_result
         self.table.total_rounds_today += 1
         self.table.total_wagered_today += total_wagered
+        self.table.touch()
+        self.leaderboard_version += 1
 
         logger.info(
             f"Round {self.table.round_number} settled: {result_number} ({result_color}). "
@@ -444,7 +469,7 @@ class GameEngine:
             "round_number": self.table.round_number,
             "table_id": self.table.table_id,
             "seated_bots": list(self.table.seated_bots.values()),
-            "current_bets": [bet.model_dump() for bet in self.table.current_bets],
+            "current_bets": self.table.current_bets,
         }
 
         if result_number is not None:
@@ -468,10 +493,10 @@ class GameEngine:
             "round_number": round_result.round_number,
             "result_number": round_result.result_number,
             "result_color": round_result.result_color,
-            "bets": [bet.model_dump() for bet in round_result.bets],
+            "bets": round_result.bets,
             "total_wagered": round_result.total_wagered,
             "total_payout": round_result.total_payout,
-            "leaderboard": [entry.model_dump() for entry in leaderboard],
+            "leaderboard": leaderboard,
         }
 
         await self.ws_manager.broadcast(data)
@@ -484,12 +509,31 @@ class GameEngine:
         """
         Get top bots by balance.
 
+        The result is cached until the next settlement (or LEADERBOARD_CACHE_TTL_SECONDS)
+        and shared between callers, so it must not be mutated.
+
         Args:
             limit: Maximum number of entries to return
 
         Returns:
             List of LeaderboardEntry sorted by balance descending
         """
+        now = time.monotonic()
+        cached = self._leaderboard_cache
+        if (
+            cached is not None
+            and cached[0] == self.leaderboard_version
+            and cached[1] == limit
+            and now - cached[2] < LEADERBOARD_CACHE_TTL_SECONDS
+        ):
+            return cached[3]
+
+        leaderboard = self._build_leaderboard(limit)
+        self._leaderboard_cache = (self.leaderboard_version, limit, now, leaderboard)
+        return leaderboard
+
+    def _build_leaderboard(self, limit: int) -> List[LeaderboardEntry]:
+        """Scan all bots and build the leaderboard (uncached)."""
         bots_db = get_db_handle_bots()
         all_bots = list(bots_db.values())
 
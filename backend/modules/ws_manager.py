@@ -5,69 +5,308 @@ This module handles real-time communication with frontend clients,
 broadcasting game state updates, phase changes, and round results.
 """
 
+import asyncio
 import logging
-import json
-from typing import List
+from typing import Any, Dict, List, Optional, Set, Tuple, Union
+import msgpack
 from fastapi import WebSocket
+from pydantic_core import to_json, to_jsonable_python
 
 logger = logging.getLogger(__name__)
 
+# Maximum time a single spectator send may take before the client is dropped
+SEND_TIMEOUT_SECONDS = 0.5
+
+# Bets arriving within this window are coalesced into a single "new_bets" frame
+BET_BATCH_WINDOW_SECONDS = 0.05
+
+# Frames a spectator may fall behind by before it is treated as stuck and dropped
+SEND_QUEUE_MAX_FRAMES = 256
+
+
+# Wire formats a spectator can negotiate with ?fmt=
+FORMAT_JSON = "json"
+FORMAT_MSGPACK = "msgpack"
+
+# One-byte message type tags used in msgpack frames instead of the "type" string
+MSGPACK_TYPE_TAGS = {
+    "initial_state": 0,
+    "phase_change": 1,
+    "new_bet": 2,
+    "new_bets": 3,
+    "chat_message": 4,
+    "round_result": 5,
+    "batch": 6,
+}
+
+
+def encode_message(data: Any) -> str:
+    """
+    Serialize a spectator message to a JSON text frame.
+
+    Pydantic models may be embedded directly; they are encoded by pydantic-core
+    in the same pass, so callers don't need to model_dump() them first.
+    """
+    return to_json(data, fallback=str).decode()
+
+
+def encode_msgpack_message(data: dict) -> bytes:
+    """
+    Serialize a spectator message to a binary msgpack frame.
+
+    Same structure as the JSON frame, except "type" is replaced by a
+    one-byte tag under "t" (see MSGPACK_TYPE_TAGS).
+    """
+    payload = to_jsonable_python(data, fallback=str)
+    message_type = payload.pop("type", None)
+    payload["t"] = MSGPACK_TYPE_TAGS.get(message_type, message_type)
+    return msgpack.packb(payload, use_bin_type=True)
+
+
+def encode_frame(data: dict, fmt: str) -> Union[str, bytes]:
+    """Serialize a spectator message in the given wire format."""
+    if fmt == FORMAT_MSGPACK:
+        return encode_msgpack_message(data)
+    return encode_message(data)
+
+
+def batch_frames(frames: List[Union[str, bytes]]) -> Union[str, bytes]:
+    """
+    Combine already-encoded frames into one {"type": "batch", "events": [...]} frame.
+
+    The events are spliced in as-is, so nothing is re-serialized.
+    All frames must share one wire format.
+    """
+    if isinstance(frames[0], bytes):
+        packer = msgpack.Packer(use_bin_type=True)
+        return b"".join([
+            packer.pack_map_header(2),
+            packer.pack("t"), packer.pack(MSGPACK_TYPE_TAGS["batch"]),
+            packer.pack("events"), packer.pack_array_header(len(frames)),
+            *frames,
+        ])
+    return '{"type":"batch","events":[' + ",".join(frames) + "]}"
+
 
 class WebSocketManager:
-    """Manages WebSocket connections for spectators."""
+    """
+    Manages WebSocket connections for spectators.
+
+    Each spectator has its own send queue drained by a dedicated sender task.
+    Frames that pile up while a send is in flight are delivered together as one
+    "batch" frame, so bursts of events don't turn into bursts of small writes.
+    """
 
     def __init__(self):
         self.active_connections: List[WebSocket] = []
+        self._msgpack_connections: Set[WebSocket] = set()
+        self._queues: Dict[WebSocket, asyncio.Queue] = {}
+        self._sender_tasks: Dict[WebSocket, asyncio.Task] = {}
+        self._background_tasks: Set[asyncio.Task] = set()
+        self._pending_bets: Dict[str, List[dict]] = {}  # table_id -> bets awaiting flush
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
         logger.info("WebSocketManager initialized")
 
-    async def connect(self, websocket: WebSocket) -> None:
+    async def connect(self, websocket: WebSocket, fmt: str = FORMAT_JSON) -> None:
         """
-        Accept a new WebSocket connection.
+        Accept a new WebSocket connection and start its sender task.
 
         Args:
             websocket: The WebSocket connection to accept
+            fmt: Wire format for this client - FORMAT_JSON (text) or FORMAT_MSGPACK (binary)
         """
         await websocket.accept()
         self.active_connections.append(websocket)
+        if fmt == FORMAT_MSGPACK:
+            self._msgpack_connections.add(websocket)
+        queue = asyncio.Queue(maxsize=SEND_QUEUE_MAX_FRAMES)
+        self._queues[websocket] = queue
+        self._sender_tasks[websocket] = asyncio.create_task(self._sender(websocket, queue))
         logger.info(f"Spectator connected. Total: {len(self.active_connections)}")
 
     def disconnect(self, websocket: WebSocket) -> None:
         """
-        Remove a WebSocket connection.
+        Remove a WebSocket connection and stop its sender task.
 
         Args:
             websocket: The WebSocket connection to remove
         """
+        self._msgpack_connections.discard(websocket)
+        self._queues.pop(websocket, None)
+        task = self._sender_tasks.pop(websocket, None)
+        if task is not None and task is not asyncio.current_task():
+            task.cancel()
         if websocket in self.active_connections:
             self.active_connections.remove(websocket)
             logger.info(f"Spectator disconnected. Total: {len(self.active_connections)}")
 
+    def send(self, websocket: WebSocket, message: Union[str, bytes]) -> None:
+        """
+        Queue a pre-encoded message for a single spectator.
+
+        Args:
+            websocket: A connected spectator
+            message: Frame encoded in the spectator's wire format
+        """
+        if not self._enqueue(websocket, message):
+            self._drop(websocket)
+
+    async def _send(self, connection: WebSocket, message: Union[str, bytes]) -> bool:
+        """
+        Send a pre-serialized message to one spectator with a timeout.
+
+        Text messages go out as text frames, bytes as binary frames.
+
+        Returns:
+            True if the message was delivered, False if the client is slow or dead
+        """
+        try:
+            if isinstance(message, bytes):
+                send = connection.send_bytes(message)
+            else:
+                send = connection.send_text(message)
+            await asyncio.wait_for(send, timeout=SEND_TIMEOUT_SECONDS)
+            return True
+        except asyncio.TimeoutError:
+            logger.warning(f"Spectator send timed out after {SEND_TIMEOUT_SECONDS}s, dropping client")
+        except Exception as e:
+            logger.warning(f"Failed to send message to spectator: {e}")
+        return False
+
+    async def _sender(self, websocket: WebSocket, queue: asyncio.Queue) -> None:
+        """
+        Per-spectator send loop.
+
+        Blocks for the next frame, then drains everything else already queued
+        and sends it all as a single frame. Idle streams send each event as it
+        comes; bursts coalesce on their own.
+        """
+        while True:
+            frames = [await queue.get()]
+            while True:
+                try:
+                    frames.append(queue.get_nowait())
+                except asyncio.QueueEmpty:
+                    break
+
+            message = frames[0] if len(frames) == 1 else batch_frames(frames)
+            if not await self._send(websocket, message):
+                break
+
+        self.disconnect(websocket)
+        await self._close_quietly(websocket)
+
+    async def _close_quietly(self, connection: WebSocket) -> None:
+        """Close a dropped spectator connection, ignoring errors and slow peers."""
+        try:
+            await asyncio.wait_for(connection.close(code=1008), timeout=SEND_TIMEOUT_SECONDS)
+        except Exception:
+            pass
+
+    def _spawn(self, coro) -> None:
+        """Run a coroutine in the background, keeping a reference until it finishes."""
+        task = asyncio.create_task(coro)
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+
+    def _drop(self, websocket: WebSocket) -> None:
+        """Disconnect a spectator that can't keep up and close its socket in the background."""
+        logger.warning(f"Spectator fell {SEND_QUEUE_MAX_FRAMES} frames behind, dropping client")
+        self.disconnect(websocket)
+        self._spawn(self._close_quietly(websocket))
+
+    def _enqueue(self, websocket: WebSocket, message: Union[str, bytes]) -> bool:
+        """Queue a frame for one spectator. Returns False if its queue is full."""
+        queue = self._queues.get(websocket)
+        if queue is None:
+            return True
+        try:
+            queue.put_nowait(message)
+            return True
+        except asyncio.QueueFull:
+            return False
+
+    def _encode(self, data: dict) -> Tuple[Optional[str], Optional[bytes]]:
+        """Encode a message once for each wire format currently in use."""
+        msgpack_count = len(self._msgpack_connections)
+        text = encode_message(data) if len(self.active_connections) > msgpack_count else None
+        binary = encode_msgpack_message(data) if msgpack_count else None
+        return text, binary
+
+    def _send_all(self, frames: Tuple[Optional[str], Optional[bytes]]) -> None:
+        """Queue pre-encoded frames for every spectator, dropping ones that are stuck."""
+        text, binary = frames
+        stuck = []
+        for conn in list(self.active_connections):
+            message = binary if conn in self._msgpack_connections else text
+            if message is not None and not self._enqueue(conn, message):
+                stuck.append(conn)
+
+        for conn in stuck:
+            self._drop(conn)
+
+    def _flush_bets(self) -> None:
+        """Serialize and queue all pending bets, one "new_bets" message per table."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+
+        pending, self._pending_bets = self._pending_bets, {}
+        if not self.active_connections:
+            return
+        for table_id, bets in pending.items():
+            self._send_all(self._encode({"type": "new_bets", "bets": bets, "table_id": table_id}))
+
+    def _flush_bets_sync(self) -> None:
+        """Timer callback: send bets collected during the batch window."""
+        self._flush_handle = None
+        self._flush_bets()
+
     async def broadcast(self, data: dict) -> None:
         """
-        Broadcast JSON data to all connected spectators.
+        Broadcast data to all connected spectators in each client's wire format.
+
+        Frames are queued to each spectator's sender task, so one slow client
+        cannot stall the others; clients that fail, exceed SEND_TIMEOUT_SECONDS,
+        or fall SEND_QUEUE_MAX_FRAMES behind are disconnected.
+        Any bets still waiting in the batch window are flushed first so
+        spectators always see them before the event that follows.
+
+        Args:
+            data: Dictionary (may contain Pydantic models) to send to all clients
+        """
+        self.broadcast_nowait(data)
+
+    def broadcast_nowait(self, data: dict) -> None:
+        """
+        Broadcast without awaiting; usable from synchronous code and request paths.
 
         Args:
             data: Dictionary to serialize and send to all clients
         """
+        self._flush_bets()
         if not self.active_connections:
             return
+        self._send_all(self._encode(data))
 
-        message = json.dumps(data, default=str)
-        dead_connections = []
+    def broadcast_bet(self, bet: dict, table_id: str) -> None:
+        """
+        Queue a bet for spectators without waiting.
 
-        for connection in self.active_connections:
-            try:
-                await connection.send_text(message)
-            except Exception as e:
-                logger.warning(f"Failed to send message to spectator: {e}")
-                dead_connections.append(connection)
+        Bets placed within BET_BATCH_WINDOW_SECONDS of each other are sent as
+        one {"type": "new_bets", "bets": [...]} frame instead of a frame per bet.
 
-        # Remove dead connections
-        for conn in dead_connections:
-            self.disconnect(conn)
+        Args:
+            bet: Bet data to show in the spectator feed
+            table_id: Table the bet was placed at
+        """
+        if not self.active_connections:
+            return
 
-        if dead_connections:
-            logger.info(f"Removed {len(dead_connections)} dead connections")
+        self._pending_bets.setdefault(table_id, []).append(bet)
+        if self._flush_handle is None:
+            loop = asyncio.get_running_loop()
+            self._flush_handle = loop.call_later(BET_BATCH_WINDOW_SECONDS, self._flush_bets_sync)
 
     @property
     def connection_count(self) -> int:
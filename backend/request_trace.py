@@ -1,4 +1,5 @@
 import logging
+import re
 import uuid
 from typing import Callable
 
@@ -9,7 +10,7 @@ from fastapi.exceptions import RequestValidationError
 from starlette.background import BackgroundTask
 from starlette.responses import StreamingResponse
 
-from settings import settings
+from settings import get_settings
 from core.rqid_in_logs import set_request_id
 from core.exceptions import CasinoError
 
@@ -63,22 +64,34 @@ def log_with_label(label: str, data):
 
 class RouteWithLogging(APIRoute):
     """Custom route class that logs request and response bodies"""
-    HEADER_LIST = [element.strip().lower() for element in settings.log_headers]
-    LOG_ALL_HEADERS = settings.log_headers_full
     SENSITIVE_HEADERS = ['authorization', 'x-api-key']
-    FULLY_LOG_SENSITIVE_HEADERS = settings.log_headers_sensitive
+    # API tokens sent in JSON bodies (e.g. bet batches)
+    SENSITIVE_BODY_FIELD = re.compile(r'("token"\s*:\s*")([^"]*)(")')
+
+    @staticmethod
+    def obfuscate_string(s: str) -> str:
+        if s is None or len(s) <= 13:
+            return s
+        return s[:10] + '***' + s[-3:]
+
+    def obfuscate_body(self, body: str) -> str:
+        if get_settings().log_headers_sensitive:
+            return body
+        return self.SENSITIVE_BODY_FIELD.sub(
+            lambda m: m.group(1) + self.obfuscate_string(m.group(2)) + m.group(3), body
+        )
 
     def add_headers_to_log(self, request: Request):
-        def obfuscate_string(s: str) -> str:
-            if s is None or len(s) <= 13:
-                return s
-            return s[:10] + '***' + s[-3:]
-
+        settings = get_settings()
+        if settings.log_headers_full:
+            header_list = request.headers.keys()
+        else:
+            header_list = [element.strip().lower() for element in settings.log_headers]
         headers = []
-        for header in (request.headers.keys() if self.LOG_ALL_HEADERS else self.HEADER_LIST):
+        for header in header_list:
             value = request.headers.get(header)
-            if header in self.SENSITIVE_HEADERS and not self.FULLY_LOG_SENSITIVE_HEADERS:
-                value = obfuscate_string(value)
+            if header in self.SENSITIVE_HEADERS and not settings.log_headers_sensitive:
+                value = self.obfuscate_string(value)
             headers.append(f"{header}: '{value}'")
         return "Headers: " + ", ".join(headers)
 
@@ -104,7 +117,7 @@ class RouteWithLogging(APIRoute):
                 req_body = "<binary data>"
             else:
                 try:
-                    req_body = req_body.decode("utf-8").replace("\n", " ")
+                    req_body = self.obfuscate_body(req_body.decode("utf-8").replace("\n", " "))
                 except UnicodeDecodeError:
                     req_body = "<binary data>"
 
@@ -172,7 +185,7 @@ class RouteWithLogging(APIRoute):
                     logging.error(f"Application error: {e}\n{app_tb}")
                 else:
                     logging.error(f"Application error: {e}")
-                details = {"trace": format_app_traceback(e)} if settings.debug else {}
+                details = {"trace": format_app_traceback(e)} if get_settings().debug else {}
                 return JSONResponse(
                     status_code=500,
                     content={"error": {"code": "INTERNAL_ERROR", "message": str(e), "details": details}}
@@ -14,7 +14,7 @@ from core.types import (
     VerifyOTPRequest, VerifyMagicLinkRequest, VerifyOTPResponse,
     UserInfo, SetupBotRequest, SetupBotResponse,
 )
-from settings import settings
+from settings import get_settings
 from auth import extract_jwt_data
 import httpx
 import logging
@@ -31,6 +31,7 @@ router = APIRouter(
 
 async def verify_recaptcha(recaptcha_token: str, remote_ip: str = None) -> bool:
     """Verify the reCAPTCHA token."""
+    settings = get_settings()
     if settings.recaptcha_skip:
         return True
     if not settings.recaptcha_secret_key:
@@ -158,6 +159,7 @@ async def get_me_endpoint(
     credentials: HTTPAuthorizationCredentials = Security(security),
     db_users=Depends(get_db_handle_users),
     db_bots=Depends(get_db_handle_bots),
+    settings=Depends(get_settings),
 ):
     """Get current user's info plus server-side config like MCP URL and bot balance."""
     token_data = extract_jwt_data(credentials.credentials)
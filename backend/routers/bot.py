@@ -4,7 +4,8 @@ from fastapi import APIRouter, Depends
 from request_trace import RouteWithLogging
 from auth import get_current_bot
 from modules.bot import get_bot_profile, request_refill, get_bot_history
-from core.types import BotProfile
+from core.types import BotProfile, BOT_PRIVATE_FIELDS
+from core.responses import json_response
 
 logger = logging.getLogger(__name__)
 
@@ -18,15 +19,8 @@ router = APIRouter(
 @router.get("/me")
 async def bot_me(bot_data: dict = Depends(get_current_bot)):
     """Get the authenticated bot's profile."""
-    bot = bot_data["bot"]
-    if hasattr(bot, 'model_dump'):
-        data = bot.model_dump()
-    else:
-        data = dict(bot)
-    # Remove sensitive fields
-    data.pop("api_token_hash", None)
     logger.info(f"Bot {bot_data['bot_id']} retrieved profile")
-    return data
+    return json_response(bot_data["bot"], exclude=BOT_PRIVATE_FIELDS)
 
 
 @router.post("/refill")
@@ -35,9 +29,10 @@ async def bot_refill(bot_data: dict = Depends(get_current_bot)):
     bot_id = bot_data["bot_id"]
     logger.info(f"Bot {bot_id} requesting refill")
     updated_bot = request_refill(bot_id)
-    data = updated_bot.model_dump() if hasattr(updated_bot, 'model_dump') else dict(updated_bot)
-    data.pop("api_token_hash", None)
-    return {"message": "Refill successful", "bot": data}
+    return json_response(
+        {"message": "Refill successful", "bot": updated_bot},
+        exclude={"bot": BOT_PRIVATE_FIELDS},
+    )
 
 
 @router.get("/history")
@@ -49,4 +44,4 @@ async def bot_history(
     bot_id = bot_data["bot_id"]
     logger.info(f"Bot {bot_id} retrieving history (limit={limit})")
     history = get_bot_history(bot_id, limit=min(limit, 100))
-    return {"rounds": history, "count": len(history)}
+    return json_response({"rounds": history, "count": len(history)})
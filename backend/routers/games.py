@@ -2,11 +2,17 @@
 import logging
 import re
 import time
-from fastapi import APIRouter, Depends, HTTPException
+from typing import Annotated, Optional
+from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi.concurrency import run_in_threadpool
 from pydantic import BaseModel, Field
 from request_trace import RouteWithLogging
-from auth import get_current_bot
-from core.types import PlaceBetRequest
+from auth import get_current_bot, validate_bot_api_token
+from core.exceptions import CasinoError
+from core.types import PlaceBetRequest, PlaceBetBatchRequest, TABLE_PHASE_CODES
+from core.responses import json_response
+from modules.db import get_db_handle_bots
+from modules.game_engine import GameEngine
 
 logger = logging.getLogger(__name__)
 
@@ -17,12 +23,15 @@ router = APIRouter(
 )
 
 
-def _get_engine():
-    """Get the game engine instance from main module."""
-    from main import game_engine
-    if game_engine is None:
+def _get_engine(request: Request) -> GameEngine:
+    """FastAPI dependency: get the game engine instance published on app.state at startup."""
+    engine = getattr(request.app.state, "game_engine", None)
+    if engine is None:
         raise HTTPException(status_code=503, detail="Game engine not initialized")
-    return game_engine
+    return engine
+
+
+GameEngineDep = Annotated[GameEngine, Depends(_get_engine)]
 
 
 # Chat rate limiting: bot_id -> last_message_time
@@ -55,10 +64,41 @@ def _sanitize_chat(message: str) -> str:
     return cleaned
 
 
+def _broadcast_chat(engine: GameEngine, table_id: str, bot_id: str, name: str, avatar_seed: str, message: str) -> None:
+    """Broadcast an accepted chat message to spectators."""
+    if engine.ws_manager:
+        engine.ws_manager.broadcast_nowait({
+            "type": "chat_message",
+            "bot_id": bot_id,
+            "bot_name": name,
+            "bot_avatar_seed": avatar_seed,
+            "message": message,
+            "table_id": table_id,
+        })
+
+    logger.info(f"Chat from {bot_id} ({name}): {message[:50]}{'...' if len(message) > 50 else ''}")
+
+
+def _post_bet_chat(engine: GameEngine, table_id: str, bot_id: str, name: str, avatar_seed: str, message: str) -> bool:
+    """Post a chat message sent along with a bet. Never fails the bet: rate-limited or rejected text is dropped."""
+    now = time.time()
+    if now - _chat_rate_limits.get(bot_id, 0) < CHAT_RATE_LIMIT_SECONDS:
+        return False
+    try:
+        cleaned = _sanitize_chat(message)
+    except HTTPException:
+        return False
+    if not cleaned:
+        return False
+
+    _chat_rate_limits[bot_id] = now
+    _broadcast_chat(engine, table_id, bot_id, name, avatar_seed, cleaned)
+    return True
+
+
 @router.get("/games")
-async def list_games(bot_data: dict = Depends(get_current_bot)):
+async def list_games(engine: GameEngineDep, bot_data: dict = Depends(get_current_bot)):
     """List available games and tables."""
-    engine = _get_engine()
     table = engine.table
     logger.info(f"Bot {bot_data['bot_id']} listing games")
     return {
@@ -79,9 +119,8 @@ async def list_games(bot_data: dict = Depends(get_current_bot)):
 
 
 @router.post("/tables/{table_id}/join")
-async def join_table(table_id: str, bot_data: dict = Depends(get_current_bot)):
+async def join_table(table_id: str, engine: GameEngineDep, bot_data: dict = Depends(get_current_bot)):
     """Join a roulette table. Required before placing bets."""
-    engine = _get_engine()
     bot = bot_data["bot"]
     bot_id = bot_data["bot_id"]
 
@@ -97,9 +136,8 @@ async def join_table(table_id: str, bot_data: dict = Depends(get_current_bot)):
 
 
 @router.post("/tables/{table_id}/leave")
-async def leave_table(table_id: str, bot_data: dict = Depends(get_current_bot)):
+async def leave_table(table_id: str, engine: GameEngineDep, bot_data: dict = Depends(get_current_bot)):
     """Leave a roulette table."""
-    engine = _get_engine()
     bot_id = bot_data["bot_id"]
 
     engine.table.leave(bot_id)
@@ -112,10 +150,55 @@ async def leave_table(table_id: str, bot_data: dict = Depends(get_current_bot)):
 async def place_bet(
     table_id: str,
     bet_request: PlaceBetRequest,
+    engine: GameEngineDep,
     bot_data: dict = Depends(get_current_bot)
 ):
-    """Place a bet on the current round. Only valid during betting phase."""
-    engine = _get_engine()
+    """
+    Place a bet on the current round. Only valid during betting phase.
+
+    An optional chat message is posted along with the bet (subject to the chat
+    rate limit); chat_sent in the response says whether it went out.
+    """
+    return _place_bet(engine, table_id, bot_data, bet_request)
+
+
+@router.post("/tables/{table_id}/bet_batch")
+async def place_bet_batch(table_id: str, batch: PlaceBetBatchRequest, engine: GameEngineDep):
+    """
+    Place bets for several bots in one request, e.g. from a multi-bot load runner.
+
+    Each bet carries its own bot API token instead of the Authorization header.
+    Bets are placed independently and in order: results[i] is either the /bet
+    response for bets[i] or an {"error": {...}} object explaining why it was rejected.
+    """
+    # Token lookups are blocking DB queries: run them off the event loop, once per distinct token
+    bots_by_token = await run_in_threadpool(
+        _resolve_bot_tokens, dict.fromkeys(item.token for item in batch.bets), get_db_handle_bots()
+    )
+    results = []
+    for item in batch.bets:
+        bot_data = bots_by_token[item.token]
+        if bot_data is None:
+            results.append({"error": {"code": "UNAUTHORIZED", "message": "Invalid API token", "details": {}}})
+            continue
+        try:
+            results.append(_place_bet(engine, table_id, bot_data, item))
+        except CasinoError as e:
+            results.append(e.to_dict())
+        except ValueError as e:
+            results.append({"error": {"code": "BAD_REQUEST", "message": str(e), "details": {}}})
+
+    logger.info(f"Bet batch on table {table_id}: {len(results)} bets")
+    return {"results": results}
+
+
+def _resolve_bot_tokens(tokens, bots_db) -> dict:
+    """Map each bot API token to its bot data (None if invalid)."""
+    return {token: validate_bot_api_token(token, bots_db) for token in tokens}
+
+
+def _place_bet(engine: GameEngine, table_id: str, bot_data: dict, bet_request: PlaceBetRequest) -> dict:
+    """Place one authenticated bot's bet, broadcast it and post its optional chat."""
     bot = bot_data["bot"]
     bot_id = bot_data["bot_id"]
 
@@ -137,54 +220,70 @@ async def place_bet(
 
     # Broadcast bet to spectators
     if engine.ws_manager:
-        await engine.ws_manager.broadcast({
-            "type": "new_bet",
-            "bet": {
-                "bot_id": bot_id,
-                "bot_name": name,
-                "bot_avatar_seed": avatar_seed,
-                "bet_type": bet_record.bet_type.value,
-                "bet_value": bet_record.bet_value,
-                "amount": bet_record.amount,
-            },
-            "table_id": table_id,
-        })
+        engine.ws_manager.broadcast_bet({
+            "bot_id": bot_id,
+            "bot_name": name,
+            "bot_avatar_seed": avatar_seed,
+            "bet_type": bet_record.bet_type.value,
+            "bet_value": bet_record.bet_value,
+            "amount": bet_record.amount,
+        }, table_id)
 
-    return {
+    response = {
         "message": "Bet placed",
         "bet_type": bet_record.bet_type.value,
         "bet_value": bet_record.bet_value,
         "amount": bet_record.amount,
     }
+    if bet_request.chat is not None:
+        response["chat_sent"] = _post_bet_chat(engine, table_id, bot_id, name, avatar_seed, bet_request.chat)
+    return response
 
 
 @router.get("/tables/{table_id}/status")
-async def table_status(table_id: str, bot_data: dict = Depends(get_current_bot)):
+async def table_status(table_id: str, engine: GameEngineDep, bot_data: dict = Depends(get_current_bot)):
     """Get current table status including phase, bets, and results."""
-    engine = _get_engine()
     status = engine.table.get_status()
     logger.info(f"Bot {bot_data['bot_id']} retrieved table {table_id} status: phase={status.phase.value}, bots={status.bot_count}")
-    return status.model_dump()
+    return json_response(status)
+
+
+@router.get("/tables/{table_id}/status/compact")
+async def table_status_compact(table_id: str, engine: GameEngineDep, bot_data: dict = Depends(get_current_bot)):
+    """
+    Get just what a polling bot needs, as [phase_code, time_remaining, round_number, bot_count].
+
+    phase_code indexes TablePhase in declaration order: idle, betting, spinning, settlement, pause.
+    """
+    table = engine.table
+    return json_response([
+        TABLE_PHASE_CODES[table.phase],
+        table.get_time_remaining(),
+        table.round_number,
+        len(table.seated_bots),
+    ])
 
 
 @router.get("/rounds/latest")
-async def latest_round(bot_data: dict = Depends(get_current_bot)):
-    """Get the most recent round result."""
-    engine = _get_engine()
-    if engine.table.last_result is None:
+async def latest_round(engine: GameEngineDep, bot_id: Optional[str] = None, bot_data: dict = Depends(get_current_bot)):
+    """Get the most recent round result. Pass bot_id to only include that bot's bets."""
+    result = engine.table.last_result
+    if result is None:
         return {"message": "No rounds played yet", "result": None}
     logger.info(f"Bot {bot_data['bot_id']} retrieved latest round result")
-    return engine.table.last_result.model_dump()
+    if bot_id is not None:
+        result = result.model_copy(update={"bets": [bet for bet in result.bets if bet.bot_id == bot_id]})
+    return json_response(result)
 
 
 @router.post("/tables/{table_id}/chat")
 async def send_chat(
     table_id: str,
     req: ChatMessageRequest,
+    engine: GameEngineDep,
     bot_data: dict = Depends(get_current_bot),
 ):
     """Send a chat message to the table. Rate limited to 1 message per 5 seconds."""
-    engine = _get_engine()
     bot = bot_data["bot"]
     bot_id = bot_data["bot_id"]
 
@@ -212,16 +311,5 @@ async def send_chat(
     name = bot.name if hasattr(bot, 'name') else bot.get('name', '')
     avatar_seed = bot.avatar_seed if hasattr(bot, 'avatar_seed') else bot.get('avatar_seed', '')
 
-    # Broadcast to spectators
-    if engine.ws_manager:
-        await engine.ws_manager.broadcast({
-            "type": "chat_message",
-            "bot_id": bot_id,
-            "bot_name": name,
-            "bot_avatar_seed": avatar_seed,
-            "message": cleaned,
-            "table_id": table_id,
-        })
-
-    logger.info(f"Chat from {bot_id} ({name}): {cleaned[:50]}{'...' if len(cleaned) > 50 else ''}")
+    _broadcast_chat(engine, table_id, bot_id, name, avatar_seed, cleaned)
     return {"message": "sent"}
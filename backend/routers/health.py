@@ -1,12 +1,12 @@
-from fastapi import APIRouter
-from settings import settings
+from fastapi import APIRouter, Depends
+from settings import get_settings
 import datetime
 
 router = APIRouter(prefix="", tags=["monitoring"])
 
 
 @router.get("/health")
-async def check_health():
+async def check_health(settings=Depends(get_settings)):
     """Health check endpoint to verify the service is running"""
     return {
         "status": "healthy",
@@ -28,7 +28,7 @@ async def root():
 
 
 @router.get("/api/v1/config")
-async def get_config():
+async def get_config(settings=Depends(get_settings)):
     """Get public configuration for the frontend."""
     return {
         "mock_mode": settings.mock_mode,
@@ -1,47 +1,94 @@
 """Spectator endpoints - public access, no auth required."""
 import logging
-from fastapi import APIRouter, WebSocket, WebSocketDisconnect
+import time
+from typing import Dict, Literal, Optional, Tuple, Union
+from fastapi import APIRouter, Request, WebSocket, WebSocketDisconnect
+from starlette.requests import HTTPConnection
+from pydantic_core import to_json
 from request_trace import RouteWithLogging
+from core.responses import JSONBytesResponse, json_response
+from modules.ws_manager import FORMAT_JSON, encode_frame
 
 logger = logging.getLogger(__name__)
 
+# Pre-encoded payloads are shared by all spectators while the engine state is
+# unchanged. The TTL bounds staleness of time_remaining and of bot balances
+# changed outside the engine (refills, new registrations).
+INITIAL_STATE_TTL_SECONDS = 0.5
+
+# (version key, encoded_at, payload); initial_state is cached per wire format
+_initial_state_cache: Dict[str, Tuple[tuple, float, Union[str, bytes]]] = {}
+# (leaderboard entries list, encoded body); the engine owns leaderboard freshness
+_leaderboard_cache: Optional[Tuple[list, bytes]] = None
+
 router = APIRouter(
     tags=["spectator"],
     route_class=RouteWithLogging,
 )
 
 
-def _get_engine():
-    from main import game_engine
-    return game_engine
+def _get_engine(conn: HTTPConnection):
+    """Get the game engine published on app.state at startup (None before startup)."""
+    return getattr(conn.app.state, "game_engine", None)
+
+
+def _get_ws_manager(conn: HTTPConnection):
+    """Get the WebSocket manager published on app.state at startup (None before startup)."""
+    return getattr(conn.app.state, "ws_manager", None)
+
 
+def _initial_state_message(engine, fmt: str) -> Union[str, bytes]:
+    """Get the initial_state frame, encoding it at most once per state version and format."""
+    key = (engine.table.state_version, engine.leaderboard_version)
+    now = time.monotonic()
+    cached = _initial_state_cache.get(fmt)
+    if cached is not None and cached[0] == key and now - cached[1] < INITIAL_STATE_TTL_SECONDS:
+        return cached[2]
 
-def _get_ws_manager():
-    from main import ws_manager
-    return ws_manager
+    message = encode_frame({
+        "type": "initial_state",
+        "table_status": engine.table.get_status(),
+        "leaderboard": engine.get_leaderboard(),
+    }, fmt)
+    _initial_state_cache[fmt] = (key, now, message)
+    return message
+
+
+def _leaderboard_body(engine) -> bytes:
+    """Get the encoded leaderboard response body, encoding each engine leaderboard once."""
+    global _leaderboard_cache
+    entries = engine.get_leaderboard()
+    cached = _leaderboard_cache
+    if cached is not None and cached[0] is entries:
+        return cached[1]
+
+    logger.info(f"Leaderboard encoded: {len(entries)} entries")
+    body = to_json({"leaderboard": entries, "count": len(entries)})
+    _leaderboard_cache = (entries, body)
+    return body
 
 
 @router.websocket("/ws/spectator")
-async def spectator_websocket(websocket: WebSocket):
-    """WebSocket endpoint for spectator live feed."""
-    manager = _get_ws_manager()
+async def spectator_websocket(websocket: WebSocket, fmt: Literal["json", "msgpack"] = FORMAT_JSON):
+    """
+    WebSocket endpoint for spectator live feed.
+
+    Frames are JSON text by default. Pass ?fmt=msgpack to receive binary msgpack
+    frames instead, with the message type as a one-byte tag under "t".
+    """
+    manager = _get_ws_manager(websocket)
     if manager is None:
         await websocket.close(code=1011, reason="WebSocket manager not initialized")
         return
 
-    await manager.connect(websocket)
+    await manager.connect(websocket, fmt)
     logger.info(f"Spectator connected: {websocket.client}")
 
     try:
         # Send initial state
-        engine = _get_engine()
+        engine = _get_engine(websocket)
         if engine:
-            status = engine.table.get_status()
-            await websocket.send_json({
-                "type": "initial_state",
-                "table_status": status.model_dump(mode="json"),
-                "leaderboard": [e.model_dump(mode="json") for e in engine.get_leaderboard()],
-            })
+            manager.send(websocket, _initial_state_message(engine, fmt))
             logger.info(f"Sent initial state to spectator: {websocket.client}")
 
         # Keep connection alive - wait for disconnect
@@ -60,27 +107,22 @@ async def spectator_websocket(websocket: WebSocket):
 
 
 @router.get("/api/v1/spectator/leaderboard")
-async def get_leaderboard():
+async def get_leaderboard(request: Request):
     """Get the bot leaderboard (public, no auth)."""
-    engine = _get_engine()
+    engine = _get_engine(request)
     if engine is None:
         return {"leaderboard": [], "count": 0}
 
-    entries = engine.get_leaderboard()
-    logger.info(f"Leaderboard retrieved: {len(entries)} entries")
-    return {
-        "leaderboard": [e.model_dump() for e in entries],
-        "count": len(entries),
-    }
+    return JSONBytesResponse(content=_leaderboard_body(engine))
 
 
 @router.get("/api/v1/spectator/table/{table_id}/status")
-async def spectator_table_status(table_id: str):
+async def spectator_table_status(table_id: str, request: Request):
     """Get table status (public, no auth)."""
-    engine = _get_engine()
+    engine = _get_engine(request)
     if engine is None:
         return {"error": "Game engine not initialized"}
 
     status = engine.table.get_status()
     logger.info(f"Spectator retrieved table {table_id} status: phase={status.phase.value}, bots={status.bot_count}")
-    return status.model_dump()
+    return json_response(status)
@@ -1,3 +1,4 @@
+from functools import lru_cache
 from pathlib import Path
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from pydantic import Field
@@ -70,7 +71,12 @@ class Settings(BaseSettings):
         env_prefix="",
         env_file=".env_pydantic",
         case_sensitive=False,
+        frozen=True,  # read-only after startup, so one parsed instance can be shared
+        defer_build=True,  # build the validator on first get_settings(), not at import
     )
 
 
-settings = Settings()
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Get the process-wide Settings, parsing the environment and .env file only once."""
+    return Settings()
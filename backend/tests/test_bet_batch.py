@@ -0,0 +1,36 @@
+from fastapi.testclient import TestClient
+
+import main
+import routers.games
+from auth import hash_api_token
+from core.types import BotProfile
+from modules.db import get_db_handle_bots
+
+
+def test_bet_batch_validates_each_distinct_token_once(monkeypatch):
+    lookups = []
+    validate = routers.games.validate_bot_api_token
+
+    def counting_validate(token, bots_db):
+        lookups.append(token)
+        return validate(token, bots_db)
+
+    monkeypatch.setattr(routers.games, "validate_bot_api_token", counting_validate)
+
+    with TestClient(main.app) as client:
+        bots_db = get_db_handle_bots()
+        bots_db["b1"] = BotProfile(bot_id="b1", name="Bot1", api_token_hash=hash_api_token("tok1"))
+        bots_db["b2"] = BotProfile(bot_id="b2", name="Bot2", api_token_hash=hash_api_token("tok2"))
+
+        tokens = ["tok1", "tok2", "tok1", "bad", "tok2", "bad"]
+        resp = client.post(
+            "/api/v1/tables/main/bet_batch",
+            json={"bets": [{"token": token, "bet_type": "red", "amount": 10} for token in tokens]},
+        )
+
+    assert resp.status_code == 200
+    results = resp.json()["results"]
+    assert len(results) == len(tokens)
+    assert sorted(lookups) == ["bad", "tok1", "tok2"]
+    # Invalid tokens are rejected per item; valid ones get through to the table
+    assert [r["error"]["code"] == "UNAUTHORIZED" for r in results] == [False, False, False, True, False, True]
@@ -27,59 +27,75 @@ export function useWebSocket() {
       setConnected(true);
     };
 
+    const handleMessage = (data: any): void => {
+      switch (data.type) {
+        case 'initial_state':
+          if (data.table_status) {
+            setTableState(data.table_status);
+          }
+          if (data.leaderboard) {
+            setLeaderboard(data.leaderboard);
+          }
+          break;
+
+        case 'phase_change':
+          setPhase(data.phase, data.time_remaining || 0);
+          setTableState(data);
+          break;
+
+        case 'new_bet':
+          if (data.bet) {
+            addBet(data.bet);
+          }
+          break;
+
+        case 'batch':
+          // Events queued while the server was sending arrive as one frame
+          if (Array.isArray(data.events)) {
+            data.events.forEach(handleMessage);
+          }
+          break;
+
+        case 'new_bets':
+          // Bets placed within the server's batch window arrive together
+          if (Array.isArray(data.bets)) {
+            data.bets.forEach(addBet);
+          }
+          break;
+
+        case 'chat_message':
+          addChatMessage({
+            bot_id: data.bot_id,
+            bot_name: data.bot_name,
+            bot_avatar_seed: data.bot_avatar_seed,
+            message: data.message,
+            timestamp: Date.now(),
+          });
+          break;
+
+        case 'round_result':
+          // Settlement phase — backend doesn't send a separate phase_change for this,
+          // so we set the phase here to ensure BetFeed shows results instead of empty bets
+          setPhase('settlement', 0);
+          setResult({
+            round_id: data.round_id,
+            round_number: data.round_number,
+            result_number: data.result_number,
+            result_color: data.result_color,
+            bets: data.bets || [],
+            total_wagered: data.total_wagered || 0,
+            total_payout: data.total_payout || 0,
+          });
+          if (data.leaderboard) {
+            setLeaderboard(data.leaderboard);
+          }
+          break;
+      }
+    };
+
     ws.onmessage = (event) => {
       try {
-        const data = JSON.parse(event.data);
-
-        switch (data.type) {
-          case 'initial_state':
-            if (data.table_status) {
-              setTableState(data.table_status);
-            }
-            if (data.leaderboard) {
-              setLeaderboard(data.leaderboard);
-            }
-            break;
-
-          case 'phase_change':
-            setPhase(data.phase, data.time_remaining || 0);
-            setTableState(data);
-            break;
-
-          case 'new_bet':
-            if (data.bet) {
-              addBet(data.bet);
-            }
-            break;
-
-          case 'chat_message':
-            addChatMessage({
-              bot_id: data.bot_id,
-              bot_name: data.bot_name,
-              bot_avatar_seed: data.bot_avatar_seed,
-              message: data.message,
-              timestamp: Date.now(),
-            });
-            break;
-
-          case 'round_result':
-            // Settlement phase — backend doesn't send a separate phase_change for this,
-            // so we set the phase here to ensure BetFeed shows results instead of empty bets
-            setPhase('settlement', 0);
-            setResult({
-              round_id: data.round_id,
-              round_number: data.round_number,
-              result_number: data.result_number,
-              result_color: data.result_color,
-              bets: data.bets || [],
-              total_wagered: data.total_wagered || 0,
-              total_payout: data.total_payout || 0,
-            });
-            if (data.leaderboard) {
-              setLeaderboard(data.leaderboard);
-            }
-            break;
-        }
+        handleMessage(JSON.parse(event.data));
       } catch (e) {
         console.error('WebSocket message parse error:', e);
       }
@@ -0,0 +1,168 @@
+"""
+Numba-compiled simulation kernels for the offline simulator.
+
+Stateful strategies can't be vectorized because each bet depends on the previous
+outcome, but their per-round logic is plain integer math. These kernels run that
+loop over precomputed win flags at native speed. Requires numba (pip install numba);
+simulator.py falls back to the Python loop when it is missing.
+"""
+from numba import njit
+
+
+@njit(cache=True)
+def run_martingale(wins, base_bet, max_bet, starting_balance, refill_balance, no_refill):
+    """
+    Simulate Martingale on an even-money bet: double after a loss, reset after a win.
+
+    Args:
+        wins: Boolean array, whether the chosen color wins on each spin
+        base_bet: Opening bet size
+        max_bet: Bet size cap
+        starting_balance: Balance before the first round
+        refill_balance: Balance after an automatic refill
+        no_refill: Stop at bankruptcy instead of refilling
+
+    Returns:
+        Tuple of (rounds_played, final_balance, total_wagered, total_won, rounds_won,
+        peak_balance, lowest_balance, max_win_streak, max_loss_streak, refills, skipped)
+    """
+    balance = starting_balance
+    current_bet = base_bet
+    peak_balance = starting_balance
+    lowest_balance = starting_balance
+    total_wagered = 0
+    total_won = 0
+    rounds_won = 0
+    win_streak = 0
+    loss_streak = 0
+    max_win_streak = 0
+    max_loss_streak = 0
+    refills = 0
+    skipped = 0
+    rounds_played = 0
+
+    for i in range(wins.shape[0]):
+        if balance <= 0:
+            if no_refill:
+                break
+            balance = refill_balance
+            refills += 1
+
+        rounds_played += 1
+        bet = min(current_bet, balance, max_bet)
+        won = bet >= 1 and wins[i]
+
+        if bet < 1:
+            skipped += 1
+        else:
+            total_wagered += bet
+            if won:
+                balance += bet
+                total_won += 2 * bet
+            else:
+                balance -= bet
+            if balance > peak_balance:
+                peak_balance = balance
+            if balance < lowest_balance:
+                lowest_balance = balance
+
+        if won:
+            rounds_won += 1
+            win_streak += 1
+            loss_streak = 0
+            if win_streak > max_win_streak:
+                max_win_streak = win_streak
+            current_bet = base_bet
+        else:
+            loss_streak += 1
+            win_streak = 0
+            if loss_streak > max_loss_streak:
+                max_loss_streak = loss_streak
+            # A base bet below 1 is never placed; don't double it into int64 overflow
+            if current_bet >= 1:
+                current_bet = min(current_bet * 2, max_bet)
+
+    return (
+        rounds_played, balance, total_wagered, total_won, rounds_won,
+        peak_balance, lowest_balance, max_win_streak, max_loss_streak, refills, skipped,
+    )
+
+
+@njit(cache=True)
+def run_reverse_color(colors, bet, starting_balance, refill_balance, no_refill):
+    """
+    Simulate Reverse Color: bet on the opposite of the last color, starting on red.
+
+    Args:
+        colors: Int array, color of each spin (0 = green, 1 = red, 2 = black)
+        bet: Bet size; rounds where it is below 1 or above the balance are skipped
+        starting_balance: Balance before the first round
+        refill_balance: Balance after an automatic refill
+        no_refill: Stop at bankruptcy instead of refilling
+
+    Returns:
+        Same tuple as run_martingale()
+    """
+    balance = starting_balance
+    next_color = 1
+    peak_balance = starting_balance
+    lowest_balance = starting_balance
+    total_wagered = 0
+    total_won = 0
+    rounds_won = 0
+    win_streak = 0
+    loss_streak = 0
+    max_win_streak = 0
+    max_loss_streak = 0
+    refills = 0
+    skipped = 0
+    rounds_played = 0
+
+    for i in range(colors.shape[0]):
+        if balance <= 0:
+            if no_refill:
+                break
+            balance = refill_balance
+            refills += 1
+
+        rounds_played += 1
+        color = colors[i]
+        placed = bet >= 1 and balance >= bet
+        won = placed and color == next_color
+
+        if not placed:
+            skipped += 1
+        else:
+            total_wagered += bet
+            if won:
+                balance += bet
+                total_won += 2 * bet
+            else:
+                balance -= bet
+            if balance > peak_balance:
+                peak_balance = balance
+            if balance < lowest_balance:
+                lowest_balance = balance
+
+        if won:
+            rounds_won += 1
+            win_streak += 1
+            loss_streak = 0
+            if win_streak > max_win_streak:
+                max_win_streak = win_streak
+        else:
+            loss_streak += 1
+            win_streak = 0
+            if loss_streak > max_loss_streak:
+                max_loss_streak = loss_streak
+
+        # Green keeps the current color
+        if color == 1:
+            next_color = 2
+        elif color == 2:
+            next_color = 1
+
+    return (
+        rounds_played, balance, total_wagered, total_won, rounds_won,
+        peak_balance, lowest_balance, max_win_streak, max_loss_streak, refills, skipped,
+    )
@@ -12,19 +12,64 @@ Usage (env vars, e.g. Cloud Run Job):
 """
 import argparse
 import asyncio
+import importlib.util
+import itertools
+import json
 import os
 import random
 import signal
 import sys
 import logging
 import time
-from typing import Optional
+from typing import List, Optional, Tuple
 
 import httpx
 
-from strategies import get_strategy, BotState, RED_NUMBERS
+try:
+    import orjson
+
+    _json_dumps = orjson.dumps
+    _json_loads = orjson.loads
+except ImportError:  # optional: fall back to compact stdlib encoding
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode()
+
+    _json_loads = json.loads  # accepts bytes and str, like orjson.loads
+
+try:
+    import websockets
+except ImportError:  # optional: without it the bot polls the status endpoint
+    websockets = None
+
+try:
+    import msgspec
+except ImportError:  # optional: polled round results are decoded as plain JSON
+    msgspec = None
+
+try:
+    import uvloop
+except ImportError:  # optional: faster event loop, not available on Windows
+    uvloop = None
+
+from strategies import get_strategy, BotState
 from phrases import BET_PHRASES, WIN_PHRASES, LOSE_PHRASES
 
+if msgspec is not None:
+    # Only the fields the bot reads from /rounds/latest; msgspec skips the rest
+    # of the payload (ids, timestamps, bet types) without building dicts for it
+    class _BetOutcome(msgspec.Struct, frozen=True):
+        bot_id: str = ""
+        amount: int = 0
+        payout: int = 0
+        is_winner: bool = False
+
+    class _RoundOutcome(msgspec.Struct, frozen=True):
+        result_number: Optional[int] = None
+        result_color: str = "green"
+        bets: List[_BetOutcome] = []
+
+    _round_decoder = msgspec.json.Decoder(_RoundOutcome)
+
 logging.basicConfig(
     level=logging.INFO,
     format="[%(asctime)s] %(levelname)s: %(message)s",
@@ -32,10 +77,242 @@ logging.basicConfig(
 )
 logger = logging.getLogger("bot")
 
+# HTTP/2 needs the optional h2 package (pip install "httpx[http2]"); it is only
+# negotiated over TLS, so plain-http local servers keep using HTTP/1.1.
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Phase names by the codes returned from /tables/{id}/status/compact
+TABLE_PHASES = ("idle", "betting", "spinning", "settlement", "pause")
+
+CHAT_QUEUE_MAX_MESSAGES = 8
+# How long to let queued chat messages go out when leaving
+CHAT_DRAIN_TIMEOUT_SECONDS = 2.0
+
+# Confirm the locally tracked balance with /bot/me every this many rounds
+BALANCE_CHECK_EVERY_ROUNDS = 20
+
+# Don't start a bet this close to the end of the betting window
+BET_DEADLINE_SECONDS = 3.0
+
+# Never poll tighter than this, even when a phase is about to end
+MIN_POLL_DELAY_SECONDS = 0.2
+
+# Bets that co-scheduled bots place within this window go out as one /bet_batch request
+BET_BATCH_WINDOW_SECONDS = 0.05
+# Server-side cap on bets per /bet_batch request (BET_BATCH_MAX_BETS in backend/core/types.py)
+BET_BATCH_MAX_BETS = 100
+
+SUMMARY_RULE = "=" * 60
+SUMMARY_TEMPLATE = f"""
+{SUMMARY_RULE}
+SESSION SUMMARY
+{SUMMARY_RULE}
+Bot:                {{bot_name}}
+Strategy:           {{strategy}}
+Duration:           {{minutes}}m {{seconds}}s
+Rounds played:      {{rounds_played}}
+Final balance:      {{balance}} BC
+Net profit:         {{net_profit:+d}} BC
+Total wagered:      {{total_wagered}} BC
+Total won:          {{total_won}} BC
+Win rate:           {{win_rate:.1f}}%
+Peak balance:       {{peak_balance}} BC
+Lowest balance:     {{lowest_balance}} BC
+Max win streak:     {{max_win_streak}}
+Max loss streak:    {{max_loss_streak}}
+{{roi_line}}{SUMMARY_RULE}
+"""
+
+
+def _normalize_api_url(api_url: str) -> str:
+    """Strip trailing slashes and the /mcp suffix users often paste from the dashboard."""
+    api_url = api_url.rstrip("/")
+    if api_url.endswith("/mcp"):
+        api_url = api_url[:-4]
+        logging.info(f"Stripped /mcp suffix from API URL → {api_url}")
+    return api_url
+
+
+def _spectator_url(api_url: str) -> str:
+    """WebSocket URL of the spectator stream for a (normalized) API URL."""
+    return api_url.replace("http", "ws", 1) + "/ws/spectator"
+
+
+def _new_client(api_url: str, poll_interval: float, headers: Optional[dict] = None) -> httpx.AsyncClient:
+    """Create an API client on one pooled (multiplexed on HTTP/2) connection."""
+    # Transport-level retries absorb transient connect failures
+    return httpx.AsyncClient(
+        base_url=api_url,
+        headers=headers,
+        timeout=httpx.Timeout(30.0, connect=5.0),
+        transport=httpx.AsyncHTTPTransport(
+            http2=HTTP2_AVAILABLE,
+            # Keep idle connections past the longest polling sleep (2x interval when idle)
+            limits=httpx.Limits(
+                max_keepalive_connections=4,
+                max_connections=8,
+                keepalive_expiry=max(60.0, poll_interval * 4),
+            ),
+            retries=2,
+        ),
+    )
+
+
+class BetRejected(Exception):
+    """The server refused a bet."""
+
+    def __init__(self, code: str, message: str):
+        self.code = code
+        super().__init__(message)
+
+
+class BetBatcher:
+    """Collects bets from bots sharing an event loop and posts each short window of them as one request."""
+
+    __slots__ = ("client", "_url", "_pending", "_flush_task")
+
+    def __init__(self, client: httpx.AsyncClient, table_id: str):
+        self.client = client
+        self._url = f"/api/v1/tables/{table_id}/bet_batch"
+        self._pending: list = []
+        self._flush_task: Optional[asyncio.Task] = None
+
+    async def place(self, token: str, payload: dict) -> dict:
+        """Queue one bot's bet and wait for its entry in the batch response."""
+        future = asyncio.get_running_loop().create_future()
+        if self._flush_task is None:
+            # Each window gets its own list, so a late flush can't pick up the next window's bets
+            pending = self._pending = []
+            self._flush_task = asyncio.create_task(self._flush_after_window(pending))
+            self._flush_task.add_done_callback(lambda _task: self._fail_unanswered(pending))
+        self._pending.append(({**payload, "token": token}, future))
+        return await future
+
+    def _close_window(self, pending: list):
+        """Stop adding bets to `pending`; the next bet opens a new window."""
+        if self._pending is pending:
+            self._pending = []
+            self._flush_task = None
+
+    def _fail_unanswered(self, pending: list):
+        """Fail bets the flush didn't answer (e.g. it was cancelled), so no bot waits on them forever."""
+        self._close_window(pending)
+        for _, future in pending:
+            if not future.done():
+                future.set_exception(RuntimeError("Bet batch was not sent"))
+
+    async def _flush_after_window(self, pending: list):
+        await asyncio.sleep(BET_BATCH_WINDOW_SECONDS)
+        self._close_window(pending)
+        # The server takes at most BET_BATCH_MAX_BETS bets per request
+        chunks = [pending[i:i + BET_BATCH_MAX_BETS] for i in range(0, len(pending), BET_BATCH_MAX_BETS)]
+        await asyncio.gather(*(self._post_chunk(chunk) for chunk in chunks))
+
+    async def _post_chunk(self, chunk: list):
+        """Post one request's worth of bets and settle each bet's future with its result."""
+        try:
+            resp = await self.client.post(
+                self._url, content=_json_dumps({"bets": [bet for bet, _ in chunk]}), headers=JSON_HEADERS,
+            )
+            resp.raise_for_status()
+            results = _json_loads(resp.content)["results"]
+            if len(results) != len(chunk):
+                raise ValueError(f"Bet batch returned {len(results)} results for {len(chunk)} bets")
+        except Exception as e:
+            for _, future in chunk:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        logger.debug(f"Bet batch sent: {len(chunk)} bets")
+        for (_, future), result in zip(chunk, results):
+            if not future.done():
+                future.set_result(result)
+
+
+class SpectatorFeed:
+    """One spectator WebSocket whose events are fanned out to every bot in a MultiBotRunner."""
+
+    # Queued to subscribers after the stream reconnects; None means it could not be opened
+    RECONNECTED = {"type": "reconnected"}
+
+    __slots__ = ("ws_url", "poll_interval", "_subscribers", "_last_phase", "_unavailable")
+
+    def __init__(self, ws_url: str, poll_interval: float = 2.0):
+        self.ws_url = ws_url
+        self.poll_interval = poll_interval
+        self._subscribers: List[asyncio.Queue] = []
+        self._last_phase: Optional[Tuple[dict, float]] = None  # (table status, monotonic time seen)
+        self._unavailable = False
+
+    def subscribe(self) -> asyncio.Queue:
+        """Start receiving events. A bot that subscribes late first gets the current phase."""
+        events: asyncio.Queue = asyncio.Queue()
+        if self._unavailable:
+            events.put_nowait(None)
+        elif self._last_phase is not None:
+            status, seen_at = self._last_phase
+            time_remaining = status.get("time_remaining", 0) - (time.monotonic() - seen_at)
+            events.put_nowait({**status, "type": "phase_change", "time_remaining": time_remaining})
+        self._subscribers.append(events)
+        return events
+
+    def unsubscribe(self, events: asyncio.Queue):
+        self._subscribers.remove(events)
+
+    def _publish(self, event: Optional[dict]):
+        for events in self._subscribers:
+            events.put_nowait(event)
+
+    def _remember_phase(self, event: dict):
+        event_type = event.get("type")
+        if event_type == "batch":
+            for inner in event.get("events", []):
+                self._remember_phase(inner)
+        elif event_type in ("initial_state", "phase_change"):
+            self._last_phase = (event.get("table_status", event), time.monotonic())
+
+    async def run(self):
+        """Read the stream until cancelled, reconnecting if it drops."""
+        connected = False
+        while True:
+            try:
+                async with websockets.connect(self.ws_url, open_timeout=5.0) as ws:
+                    if connected:
+                        self._publish(self.RECONNECTED)
+                    connected = True
+                    logger.info(f"Subscribed to {self.ws_url}")
+                    async for frame in ws:
+                        event = _json_loads(frame)
+                        self._remember_phase(event)
+                        self._publish(event)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                if not connected:
+                    logger.warning(f"Spectator stream unavailable ({e}), falling back to polling")
+                    self._unavailable = True
+                    self._publish(None)
+                    return
+                logger.warning(f"Spectator stream lost ({e}), reconnecting...")
+                await asyncio.sleep(self.poll_interval)
+
 
 class CasinoBot:
     """Autonomous bot that plays roulette via the REST API."""
 
+    __slots__ = (
+        "api_url", "ws_url", "token", "table_id", "max_rounds", "min_balance",
+        "_url_join", "_url_leave", "_url_status", "_url_status_full", "_compact_status", "_url_bet", "_url_chat", "_url_latest", "_bot_id", "_bot_name",
+        "poll_interval", "transport", "no_refill", "verbose", "strategy", "state", "client",
+        "_running", "_current_round", "_bet_placed_for_round", "_last_processed_round",
+        "_chat_queue", "_chat_task", "_bet_phrases", "_win_phrases", "_lose_phrases",
+        "_session_start", "_peak_balance", "_lowest_balance", "_biggest_win", "_biggest_loss",
+        "_bet_batcher", "_feed", "_auth_headers", "_json_headers", "_owns_client",
+    )
+
     def __init__(
         self,
         api_url: str,
@@ -47,62 +324,94 @@ class CasinoBot:
         max_rounds: Optional[int] = None,
         min_balance: int = 0,
         poll_interval: float = 2.0,
+        transport: str = "ws",
         no_refill: bool = False,
         verbose: bool = False,
+        bet_batcher: Optional[BetBatcher] = None,
+        client: Optional[httpx.AsyncClient] = None,
+        feed: Optional[SpectatorFeed] = None,
     ):
-        # Strip /mcp suffix — users often paste the MCP URL from the dashboard
-        api_url = api_url.rstrip("/")
-        if api_url.endswith("/mcp"):
-            api_url = api_url[:-4]
-            logging.info(f"Stripped /mcp suffix from API URL → {api_url}")
+        api_url = _normalize_api_url(api_url)
         self.api_url = api_url
+        self.ws_url = _spectator_url(api_url)
         self.token = token
         self.table_id = table_id
+        # Table endpoints, formatted once
+        table_path = f"/api/v1/tables/{table_id}"
+        self._url_join = f"{table_path}/join"
+        self._url_leave = f"{table_path}/leave"
+        self._url_status = f"{table_path}/status/compact"
+        self._url_status_full = f"{table_path}/status"
+        self._compact_status = True  # cleared if the server has no compact endpoint
+        self._url_bet = f"{table_path}/bet"
+        self._url_chat = f"{table_path}/chat"
+        self._url_latest = "/api/v1/rounds/latest"  # filtered to our bets once the bot_id is known
+        self._bot_id = ""
+        self._bot_name = "Unknown"  # set from /bot/me; labels the summary when several bots share a terminal
         self.max_rounds = max_rounds
         self.min_balance = min_balance
         self.poll_interval = poll_interval
+        self.transport = transport
         self.no_refill = no_refill
         self.verbose = verbose
 
         self.strategy = get_strategy(strategy_name, bet_size=bet_size, lucky_number=lucky_number)
         self.state = BotState()
-        self.client = httpx.AsyncClient(
-            base_url=self.api_url,
-            headers={"Authorization": f"Bearer {token}"},
-            timeout=30.0,
-        )
+        # Auth goes on each request rather than the client, so bots can share one client
+        self._auth_headers = {"Authorization": f"Bearer {token}"}
+        self._json_headers = {**JSON_HEADERS, **self._auth_headers}
+        self._owns_client = client is None
+        self.client = _new_client(api_url, poll_interval) if client is None else client
+        # Set when running under MultiBotRunner: bets go out batched with other bots',
+        # and table events come from the runner's single spectator stream
+        self._bet_batcher = bet_batcher
+        self._feed = feed
 
         self._running = False
         self._current_round = 0
         self._bet_placed_for_round = 0
+        self._last_processed_round = 0
+        # Chat is posted by a single sender task; when it falls behind, new messages are dropped
+        self._chat_queue: asyncio.Queue = asyncio.Queue(maxsize=CHAT_QUEUE_MAX_MESSAGES)
+        self._chat_task: Optional[asyncio.Task] = None
+
+        # Each bot walks its own shuffled copy of the phrase lists, so picking a
+        # phrase is a plain next() and consecutive repeats are avoided
+        self._bet_phrases = itertools.cycle(random.sample(BET_PHRASES, len(BET_PHRASES)))
+        self._win_phrases = itertools.cycle(random.sample(WIN_PHRASES, len(WIN_PHRASES)))
+        self._lose_phrases = itertools.cycle(random.sample(LOSE_PHRASES, len(LOSE_PHRASES)))
         self._session_start = 0.0
         self._peak_balance = 0
-        self._lowest_balance = float('inf')
+        self._lowest_balance = 0  # set from the profile balance in start()
         self._biggest_win = 0
         self._biggest_loss = 0
 
     async def start(self):
         """Main entry point - fetch profile, join table, run game loop."""
         self._running = True
-        self._session_start = time.time()
+        self._session_start = time.monotonic()
 
         # Get bot profile
         try:
-            resp = await self.client.get("/api/v1/bot/me")
+            resp = await self.client.get("/api/v1/bot/me", headers=self._auth_headers)
             resp.raise_for_status()
-            profile = resp.json()
+            profile = _json_loads(resp.content)
             self.state.balance = profile.get("balance", 1000)
             self._peak_balance = self.state.balance
             self._lowest_balance = self.state.balance
-            bot_name = profile.get("name", "Unknown")
-            logger.info(f"Bot: {bot_name} | Balance: {self.state.balance} BC | Strategy: {self.strategy.name}")
+            self._bot_name = profile.get("name", "Unknown")
+            self._bot_id = profile.get("bot_id", "")
+            self._url_latest = f"/api/v1/rounds/latest?bot_id={self._bot_id}"
+            logger.info(f"Bot: {self._bot_name} | Balance: {self.state.balance} BC | Strategy: {self.strategy.name}")
+            if self.verbose:
+                logger.debug(f"API connection: {resp.http_version}")
         except Exception as e:
             logger.error(f"Failed to get bot profile: {e}")
             return
 
         # Join table
         try:
-            resp = await self.client.post(f"/api/v1/tables/{self.table_id}/join")
+            resp = await self.client.post(self._url_join, headers=self._auth_headers)
             resp.raise_for_status()
             logger.info(f"Joined table '{self.table_id}'")
         except httpx.HTTPStatusError as e:
@@ -121,43 +430,144 @@ class CasinoBot:
             await self._leave_and_summary()
 
     async def _game_loop(self):
+        """Run the game loop, driven by the spectator stream unless polling was requested."""
+        if self.transport == "ws":
+            if self._feed is not None:
+                if await self._feed_loop():
+                    return
+            elif websockets is None:
+                logger.warning("websockets is not installed, falling back to polling")
+            elif await self._stream_loop():
+                return
+        await self._poll_loop()
+
+    async def _should_stop(self) -> bool:
+        """Check stop conditions, auto-refilling an empty balance first."""
+        if self.max_rounds and self.state.rounds_played >= self.max_rounds:
+            logger.info(f"Max rounds ({self.max_rounds}) reached. Stopping.")
+            return True
+
+        if self.state.balance <= self.min_balance and self.state.rounds_played > 0:
+            if self.no_refill or self.state.balance > 0:
+                logger.info(f"Balance ({self.state.balance}) at or below minimum ({self.min_balance}). Stopping.")
+                return True
+
+        # Auto-refill if balance is 0
+        if self.state.balance == 0 and not self.no_refill:
+            await self._try_refill()
+            if self.state.balance == 0:
+                logger.info("Refill failed or on cooldown. Stopping.")
+                return True
+
+        return False
+
+    async def _bet_for_round(self, round_number: int):
+        """Ask the strategy for a decision and place it for this round."""
+        decision = self.strategy.decide(self.state)
+        if decision:
+            bet_type, bet_value, amount = decision
+            success = await self._place_bet(bet_type, bet_value, amount)
+            if success:
+                self._bet_placed_for_round = round_number
+                self._current_round = round_number
+
+    async def _stream_loop(self) -> bool:
+        """
+        Event-driven game loop over the spectator WebSocket.
+
+        Phase changes arrive as they happen, so bets go out at the start of the
+        betting window and results come straight from the round_result frame.
+        Returns False if the stream could not be opened, so the caller can fall
+        back to polling.
+        """
+        connected = False
+        while self._running:
+            try:
+                async with websockets.connect(self.ws_url, open_timeout=5.0) as ws:
+                    if connected:
+                        # The server may have restarted while we were away
+                        await self._rejoin_table()
+                    connected = True
+                    logger.info(f"Subscribed to {self.ws_url}")
+                    async for frame in ws:
+                        if not await self._handle_event(_json_loads(frame)):
+                            return True
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                if not connected:
+                    logger.warning(f"Spectator stream unavailable ({e}), falling back to polling")
+                    return False
+                logger.warning(f"Spectator stream lost ({e}), reconnecting...")
+                await asyncio.sleep(self.poll_interval)
+        return True
+
+    async def _feed_loop(self) -> bool:
+        """
+        Event-driven game loop over a spectator stream shared with other bots.
+
+        Returns False if the stream could not be opened, so the caller can fall
+        back to polling.
+        """
+        events = self._feed.subscribe()
+        try:
+            while self._running:
+                event = await events.get()
+                if event is None:
+                    return False
+                if event is SpectatorFeed.RECONNECTED:
+                    # The server may have restarted while the stream was down
+                    await self._rejoin_table()
+                elif not await self._handle_event(event):
+                    return True
+            return True
+        finally:
+            self._feed.unsubscribe(events)
+
+    async def _handle_event(self, event: dict) -> bool:
+        """Dispatch one spectator event. Returns False when the bot should stop."""
+        if not self._running:
+            return False
+
+        event_type = event.get("type")
+        if event_type == "batch":
+            for inner in event.get("events", []):
+                if not await self._handle_event(inner):
+                    return False
+        elif event_type in ("initial_state", "phase_change"):
+            status = event.get("table_status", event)
+            round_number = status.get("round_number", 0)
+            if status.get("phase") == "betting" and self._bet_placed_for_round != round_number:
+                if await self._should_stop():
+                    return False
+                if status.get("time_remaining", 0) > BET_DEADLINE_SECONDS:
+                    await self._bet_for_round(round_number)
+        elif event_type == "round_result":
+            round_number = event.get("round_number", 0)
+            if self._bet_placed_for_round == round_number and round_number > self._last_processed_round:
+                await self._process_results(round_number, event)
+                self._last_processed_round = round_number
+                # Don't wait for the next betting window to notice we're done
+                if await self._should_stop():
+                    return False
+        return True
+
+    async def _poll_loop(self):
         """Polling-based game loop."""
-        last_processed_round = 0
         idle_rejoin_attempted = False
 
         while self._running:
-            # Check stop conditions
-            if self.max_rounds and self.state.rounds_played >= self.max_rounds:
-                logger.info(f"Max rounds ({self.max_rounds}) reached. Stopping.")
+            if await self._should_stop():
                 break
 
-            if self.state.balance <= self.min_balance and self.state.rounds_played > 0:
-                if self.no_refill or self.state.balance > 0:
-                    logger.info(f"Balance ({self.state.balance}) at or below minimum ({self.min_balance}). Stopping.")
-                    break
-
-            # Auto-refill if balance is 0
-            if self.state.balance == 0 and not self.no_refill:
-                await self._try_refill()
-                if self.state.balance == 0:
-                    logger.info("Refill failed or on cooldown. Stopping.")
-                    break
-
             # Poll table status
             try:
-                resp = await self.client.get(f"/api/v1/tables/{self.table_id}/status")
-                resp.raise_for_status()
-                status = resp.json()
+                phase, time_remaining, round_number, bot_count = await self._fetch_status()
             except Exception as e:
                 logger.warning(f"Failed to get table status: {e}")
                 await asyncio.sleep(self.poll_interval)
                 continue
 
-            phase = status.get("phase", "idle")
-            time_remaining = status.get("time_remaining", 0)
-            round_number = status.get("round_number", 0)
-            bot_count = status.get("bot_count", 0)
-
             if self.verbose:
                 logger.debug(f"Phase: {phase}, Round: #{round_number}, Time: {time_remaining:.1f}s, Bots: {bot_count}")
 
@@ -172,118 +582,203 @@ class CasinoBot:
                 idle_rejoin_attempted = False
 
             # Place bet during betting phase
-            if phase == "betting" and time_remaining > 3.0 and self._bet_placed_for_round != round_number:
-                decision = self.strategy.decide(self.state)
-                if decision:
-                    bet_type, bet_value, amount = decision
-                    success = await self._place_bet(bet_type, bet_value, amount)
-                    if success:
-                        self._bet_placed_for_round = round_number
-                        self._current_round = round_number
+            if phase == "betting" and time_remaining > BET_DEADLINE_SECONDS and self._bet_placed_for_round != round_number:
+                await self._bet_for_round(round_number)
 
             # Check for new results
-            if phase in ("settlement", "pause") and round_number > last_processed_round and self._bet_placed_for_round == round_number:
+            if phase in ("settlement", "pause") and round_number > self._last_processed_round and self._bet_placed_for_round == round_number:
                 await self._process_results(round_number)
-                last_processed_round = round_number
+                self._last_processed_round = round_number
+
+            await asyncio.sleep(self._poll_delay(phase, time_remaining, round_number))
 
-            await asyncio.sleep(self.poll_interval)
+    async def _fetch_status(self) -> Tuple[str, float, int, int]:
+        """
+        Poll the table status, in compact positional form when the server supports it.
+
+        Returns:
+            Tuple of (phase, time_remaining, round_number, bot_count)
+        """
+        if self._compact_status:
+            resp = await self.client.get(self._url_status, headers=self._auth_headers)
+            if resp.status_code != 404:
+                resp.raise_for_status()
+                phase_code, time_remaining, round_number, bot_count = _json_loads(resp.content)
+                return TABLE_PHASES[phase_code], time_remaining, round_number, bot_count
+            # Older servers have no compact endpoint; use the full status from now on
+            logger.info("Compact table status not available, polling the full status")
+            self._compact_status = False
+
+        resp = await self.client.get(self._url_status_full, headers=self._auth_headers)
+        resp.raise_for_status()
+        status = _json_loads(resp.content)
+        return (
+            status.get("phase", "idle"),
+            status.get("time_remaining", 0),
+            status.get("round_number", 0),
+            status.get("bot_count", 0),
+        )
+
+    def _poll_delay(self, phase: str, time_remaining: float, round_number: int) -> float:
+        """Pick the next poll delay, using the server's time_remaining as a scheduling hint."""
+        if phase == "betting":
+            if self._bet_placed_for_round == round_number or time_remaining <= BET_DEADLINE_SECONDS:
+                # Nothing left to do until the wheel spins
+                return max(MIN_POLL_DELAY_SECONDS, time_remaining)
+            return max(MIN_POLL_DELAY_SECONDS, min(time_remaining - BET_DEADLINE_SECONDS, self.poll_interval))
+        if phase in ("spinning", "settlement", "pause"):
+            # Results are handled on the poll that sees settlement (or pause), so just
+            # wake when the phase ends; after pause that's the next betting window
+            return max(MIN_POLL_DELAY_SECONDS, time_remaining)
+        # idle: no timer running, wait for other bots to join
+        return self.poll_interval * 2
+
+    def _post_json(self, url: str, body: bytes):
+        """POST an already-encoded JSON body (see _json_dumps)."""
+        return self.client.post(url, content=body, headers=self._json_headers)
 
     async def _place_bet(self, bet_type: str, bet_value: Optional[int], amount: int) -> bool:
         """Place a bet via the REST API."""
         payload = {"bet_type": bet_type, "amount": amount}
         if bet_value is not None:
             payload["bet_value"] = bet_value
+        # Send a random bet phrase ~60% of the time, riding on the bet request
+        chat = next(self._bet_phrases) if random.random() < 0.6 else None
+        if chat is not None:
+            payload["chat"] = chat
+        # Encode once; the body is reused if the bet has to be retried
+        body = _json_dumps(payload) if self._bet_batcher is None else b""
 
         try:
-            resp = await self.client.post(
-                f"/api/v1/tables/{self.table_id}/bet",
-                json=payload,
-            )
-            resp.raise_for_status()
+            placed = await self._submit_bet(payload, body)
 
             bet_desc = f"{amount} BC on {bet_type}"
             if bet_value is not None:
                 bet_desc += f" ({bet_value})"
             logger.info(f"Bet placed: {bet_desc}")
 
-            # Send a random bet phrase ~60% of the time
-            if random.random() < 0.6:
-                await self._send_chat(random.choice(BET_PHRASES))
+            # Older servers ignore the chat field; post it separately there
+            if chat is not None and "chat_sent" not in placed:
+                self._chat_in_background(chat)
 
             return True
-        except httpx.HTTPStatusError as e:
+        except BetRejected as e:
             # Auto-rejoin if we lost our seat (e.g. after backend restart)
-            if e.response.status_code == 400 and "NOT_SEATED" in e.response.text:
+            if e.code == "BOT_NOT_SEATED":
                 logger.warning("Not seated — rejoining table and retrying bet...")
                 await self._rejoin_table()
                 try:
-                    retry = await self.client.post(
-                        f"/api/v1/tables/{self.table_id}/bet",
-                        json=payload,
-                    )
-                    retry.raise_for_status()
+                    await self._submit_bet(payload, body)
                     logger.info(f"Bet placed after rejoin: {amount} BC on {bet_type}")
                     return True
                 except Exception as retry_err:
                     logger.warning(f"Bet retry after rejoin failed: {retry_err}")
                     return False
-            logger.warning(f"Bet failed ({e.response.status_code}): {e.response.text}")
+            logger.warning(f"Bet failed ({e.code}): {e}")
             return False
         except Exception as e:
             logger.warning(f"Bet error: {e}")
             return False
 
-    async def _process_results(self, round_number: int):
-        """Fetch and process round results."""
-        try:
-            resp = await self.client.get("/api/v1/rounds/latest")
-            resp.raise_for_status()
-            result = resp.json()
-        except Exception as e:
-            logger.warning(f"Failed to get results: {e}")
-            return
+    async def _submit_bet(self, payload: dict, body: bytes) -> dict:
+        """Send a bet on its own or through the shared batcher. Raises BetRejected if the server refuses it."""
+        if self._bet_batcher is not None:
+            placed = await self._bet_batcher.place(self.token, payload)
+            error = placed.get("error")
+        else:
+            resp = await self._post_json(self._url_bet, body)
+            if resp.is_success:
+                return _json_loads(resp.content)
+            try:
+                error = _json_loads(resp.content).get("error")
+            except ValueError:
+                error = None
+            if not isinstance(error, dict):
+                error = {"code": f"HTTP {resp.status_code}", "message": resp.text}
+
+        if error is not None:
+            raise BetRejected(error.get("code", ""), error.get("message", ""))
+        return placed
 
+    def _tally_result(self, result: dict) -> Optional[Tuple[int, str, int, int, bool]]:
+        """
+        Sum up this bot's bets in a round result.
+
+        Returns:
+            Tuple of (result_number, result_color, wagered, payout, won),
+            or None if no round has been played yet.
+        """
         if result.get("result") is None and "result_number" not in result:
-            return
+            return None
+
+        my_wagered = 0
+        my_payout = 0
+        won = False
+        # Stream frames carry every bot's bets; polled results are already filtered server-side
+        for bet in result.get("bets", []):
+            if bet.get("bot_id") != self._bot_id:
+                continue
+            my_wagered += bet.get("amount", 0)
+            my_payout += bet.get("payout", 0)
+            if bet.get("is_winner", False):
+                won = True
+        return result.get("result_number", 0), result.get("result_color", "green"), my_wagered, my_payout, won
 
-        result_number = result.get("result_number", 0)
-        result_color = result.get("result_color", "green")
+    def _decode_latest(self, content: bytes) -> Optional[Tuple[int, str, int, int, bool]]:
+        """Tally a /rounds/latest response body, decoding only the needed fields when msgspec is installed."""
+        if msgspec is None:
+            return self._tally_result(_json_loads(content))
+
+        result = _round_decoder.decode(content)
+        if result.result_number is None:
+            return None
 
-        # Find our bets in the results
-        bets = result.get("bets", [])
         my_wagered = 0
         my_payout = 0
         won = False
+        for bet in result.bets:
+            if bet.bot_id != self._bot_id:
+                continue
+            my_wagered += bet.amount
+            my_payout += bet.payout
+            if bet.is_winner:
+                won = True
+        return result.result_number, result.result_color, my_wagered, my_payout, won
 
-        # Refresh balance
-        try:
-            me_resp = await self.client.get("/api/v1/bot/me")
-            me_resp.raise_for_status()
-            self.state.balance = me_resp.json().get("balance", self.state.balance)
-        except Exception:
-            pass
+    async def _process_results(self, round_number: int, result: Optional[dict] = None):
+        """Process round results, fetching them unless already pushed over the stream."""
+        if result is None:
+            try:
+                resp = await self.client.get(self._url_latest, headers=self._auth_headers)
+                resp.raise_for_status()
+                outcome = self._decode_latest(resp.content)
+            except Exception as e:
+                logger.warning(f"Failed to get results: {e}")
+                return
+        else:
+            outcome = self._tally_result(result)
+
+        if outcome is None:
+            return
+        result_number, result_color, my_wagered, my_payout, won = outcome
+
+        # Track the balance locally (settlement applies payout - wagered) and
+        # only confirm it against the server every few rounds
+        net = my_payout - my_wagered
+        self.state.balance += net
 
-        for bet in bets:
-            # bot_id might be nested
-            bid = bet.get("bot_id", "")
-            if bid:  # We can't easily know our bot_id, check by name or just use all bets if alone
-                my_wagered += bet.get("amount", 0)
-                payout = bet.get("payout", 0)
-                my_payout += payout
-                if bet.get("is_winner", False):
-                    won = True
-
-        # If we can't match by bot_id, at least track the round
         self.state.update_after_round(result_number, result_color, won, my_payout, my_wagered)
         self.strategy.on_result(result_number, result_color, won, self.state)
 
+        if self.state.rounds_played % BALANCE_CHECK_EVERY_ROUNDS == 0:
+            await self._reconcile_balance()
+
         # Track peaks
         if self.state.balance > self._peak_balance:
             self._peak_balance = self.state.balance
         if self.state.balance < self._lowest_balance:
             self._lowest_balance = self.state.balance
 
-        net = my_payout - my_wagered
         if net > self._biggest_win:
             self._biggest_win = net
         if net < self._biggest_loss:
@@ -297,15 +792,29 @@ class CasinoBot:
 
         # Send a reaction phrase ~70% of the time
         if random.random() < 0.7:
-            phrase = random.choice(WIN_PHRASES) if won else random.choice(LOSE_PHRASES)
-            await self._send_chat(phrase)
+            phrase = next(self._win_phrases if won else self._lose_phrases)
+            self._chat_in_background(phrase)
+
+    async def _reconcile_balance(self):
+        """Re-read the balance from /bot/me, correcting any drift from local tracking."""
+        try:
+            resp = await self.client.get("/api/v1/bot/me", headers=self._auth_headers)
+            resp.raise_for_status()
+            balance = _json_loads(resp.content).get("balance", self.state.balance)
+        except Exception as e:
+            logger.warning(f"Balance check failed: {e}")
+            return
+
+        if balance != self.state.balance:
+            logger.info(f"Balance drift: tracked {self.state.balance} BC, server {balance} BC")
+            self.state.balance = balance
 
     async def _try_refill(self):
         """Try to refill BotChips."""
         try:
-            resp = await self.client.post("/api/v1/bot/refill")
+            resp = await self.client.post("/api/v1/bot/refill", headers=self._auth_headers)
             resp.raise_for_status()
-            data = resp.json()
+            data = _json_loads(resp.content)
             bot = data.get("bot", {})
             self.state.balance = bot.get("balance", self.state.balance)
             logger.info(f"Refill successful! Balance: {self.state.balance} BC")
@@ -314,13 +823,28 @@ class CasinoBot:
         except Exception as e:
             logger.warning(f"Refill error: {e}")
 
+    def _chat_in_background(self, message: str):
+        """Queue a chat message without holding up the game loop."""
+        if self._chat_task is None:
+            self._chat_task = asyncio.create_task(self._chat_sender())
+        try:
+            self._chat_queue.put_nowait(message)
+        except asyncio.QueueFull:
+            pass  # Chat is non-critical, drop like a rate-limited message
+
+    async def _chat_sender(self):
+        """Post queued chat messages one at a time."""
+        while True:
+            message = await self._chat_queue.get()
+            try:
+                await self._send_chat(message)
+            finally:
+                self._chat_queue.task_done()
+
     async def _send_chat(self, message: str):
         """Send a chat message to the table."""
         try:
-            resp = await self.client.post(
-                f"/api/v1/tables/{self.table_id}/chat",
-                json={"message": message},
-            )
+            resp = await self._post_json(self._url_chat, _json_dumps({"message": message}))
             resp.raise_for_status()
             if self.verbose:
                 logger.debug(f"Chat sent: {message}")
@@ -335,7 +859,7 @@ class CasinoBot:
     async def _rejoin_table(self):
         """Attempt to rejoin the table (e.g., after server restart)."""
         try:
-            resp = await self.client.post(f"/api/v1/tables/{self.table_id}/join")
+            resp = await self.client.post(self._url_join, headers=self._auth_headers)
             resp.raise_for_status()
             logger.info(f"Rejoined table '{self.table_id}' successfully")
         except httpx.HTTPStatusError as e:
@@ -348,48 +872,99 @@ class CasinoBot:
 
     async def _leave_and_summary(self):
         """Leave the table and print session summary."""
+        # Let queued chat messages go out before closing the client
+        if self._chat_task is not None:
+            try:
+                await asyncio.wait_for(self._chat_queue.join(), timeout=CHAT_DRAIN_TIMEOUT_SECONDS)
+            except asyncio.TimeoutError:
+                pass
+            self._chat_task.cancel()
+
         # Leave table
         try:
-            await self.client.post(f"/api/v1/tables/{self.table_id}/leave")
+            await self.client.post(self._url_leave, headers=self._auth_headers)
         except Exception:
             pass
 
-        await self.client.aclose()
+        if self._owns_client:
+            await self.client.aclose()
 
         # Session summary
-        duration = time.time() - self._session_start
-        minutes = int(duration // 60)
-        seconds = int(duration % 60)
-
-        print("\n" + "=" * 60)
-        print("SESSION SUMMARY")
-        print("=" * 60)
-        print(f"Strategy:           {self.strategy.name}")
-        print(f"Duration:           {minutes}m {seconds}s")
-        print(f"Rounds played:      {self.state.rounds_played}")
-        print(f"Final balance:      {self.state.balance} BC")
-        print(f"Net profit:         {self.state.net_profit:+d} BC")
-        print(f"Total wagered:      {self.state.total_wagered} BC")
-        print(f"Total won:          {self.state.total_won} BC")
-        print(f"Win rate:           {self.state.win_rate:.1f}%")
-        print(f"Peak balance:       {self._peak_balance} BC")
-        print(f"Lowest balance:     {self._lowest_balance} BC")
-        print(f"Max win streak:     {self.state.max_consecutive_wins}")
-        print(f"Max loss streak:    {self.state.max_consecutive_losses}")
-        if self.state.total_wagered > 0:
-            roi = (self.state.net_profit / self.state.total_wagered) * 100
-            print(f"ROI:                {roi:+.2f}%")
-        print("=" * 60)
+        duration = time.monotonic() - self._session_start
+        state = self.state
+        roi_line = ""
+        if state.total_wagered > 0:
+            roi = (state.net_profit / state.total_wagered) * 100
+            roi_line = f"ROI:                {roi:+.2f}%\n"
+
+        # One write keeps the summary contiguous when several bots share a terminal
+        sys.stdout.write(SUMMARY_TEMPLATE.format(
+            bot_name=self._bot_name,
+            strategy=self.strategy.name,
+            minutes=int(duration // 60),
+            seconds=int(duration % 60),
+            rounds_played=state.rounds_played,
+            balance=state.balance,
+            net_profit=state.net_profit,
+            total_wagered=state.total_wagered,
+            total_won=state.total_won,
+            win_rate=state.win_rate,
+            peak_balance=self._peak_balance,
+            lowest_balance=self._lowest_balance,
+            max_win_streak=state.max_consecutive_wins,
+            max_loss_streak=state.max_consecutive_losses,
+            roi_line=roi_line,
+        ))
+        sys.stdout.flush()
 
     def stop(self):
         """Signal the bot to stop."""
         self._running = False
 
 
+class MultiBotRunner:
+    """
+    Runs several bots in one event loop over shared connections.
+
+    The bots share one HTTP client and one spectator stream, and their bets go
+    out through one BetBatcher.
+    """
+
+    def __init__(self, api_url: str, tokens: List[str], table_id: str = "main", poll_interval: float = 2.0, **bot_kwargs):
+        api_url = _normalize_api_url(api_url)
+        self.client = _new_client(api_url, poll_interval)
+        batcher = BetBatcher(self.client, table_id)
+        self.feed = None
+        if bot_kwargs.get("transport", "ws") == "ws" and websockets is not None:
+            self.feed = SpectatorFeed(_spectator_url(api_url), poll_interval)
+        self.bots = [
+            CasinoBot(
+                api_url, token, table_id=table_id, poll_interval=poll_interval,
+                bet_batcher=batcher, client=self.client, feed=self.feed, **bot_kwargs,
+            )
+            for token in tokens
+        ]
+
+    async def start(self):
+        """Run all bots until each one stops."""
+        feed_task = asyncio.create_task(self.feed.run()) if self.feed is not None else None
+        try:
+            await asyncio.gather(*(bot.start() for bot in self.bots))
+        finally:
+            if feed_task is not None:
+                feed_task.cancel()
+            await self.client.aclose()
+
+    def stop(self):
+        """Signal every bot to stop."""
+        for bot in self.bots:
+            bot.stop()
+
+
 def main():
     parser = argparse.ArgumentParser(description="AI Bot Casino - Test Bot Client")
     parser.add_argument("--api-url", default=None, help="Casino API base URL (env: API_URL)")
-    parser.add_argument("--token", default=None, help="Bot API token (env: API_TOKEN)")
+    parser.add_argument("--token", default=None, help="Bot API token; comma-separate several to run them together (env: API_TOKEN)")
     parser.add_argument("--strategy", default=None, help="Betting strategy (env: STRATEGY, default: random)")
     parser.add_argument("--table", default=None, help="Table ID (env: TABLE_ID, default: main)")
     parser.add_argument("--bet-size", type=int, default=None, help="Base bet size (env: BET_SIZE, default: 10)")
@@ -397,6 +972,7 @@ def main():
     parser.add_argument("--max-rounds", type=int, default=None, help="Stop after N rounds (env: MAX_ROUNDS)")
     parser.add_argument("--min-balance", type=int, default=None, help="Stop if balance drops below (env: MIN_BALANCE)")
     parser.add_argument("--poll-interval", type=float, default=None, help="Seconds between polls (env: POLL_INTERVAL, default: 2.0)")
+    parser.add_argument("--transport", choices=("ws", "poll"), default=None, help="Table updates via WebSocket push or status polling (env: TRANSPORT, default: ws)")
     parser.add_argument("--no-refill", action="store_true", help="Disable auto-refill (env: NO_REFILL=1)")
     parser.add_argument("--verbose", action="store_true", help="Enable debug logging (env: VERBOSE=1)")
 
@@ -413,6 +989,7 @@ def main():
     max_rounds = args.max_rounds if args.max_rounds is not None else (int(max_rounds_str) if max_rounds_str else None)
     min_balance = args.min_balance if args.min_balance is not None else int(os.environ.get("MIN_BALANCE", "0"))
     poll_interval = args.poll_interval if args.poll_interval is not None else float(os.environ.get("POLL_INTERVAL", "2.0"))
+    transport = args.transport or os.environ.get("TRANSPORT", "ws")
     no_refill = args.no_refill or os.environ.get("NO_REFILL", "").lower() in ("1", "true", "yes")
     verbose = args.verbose or os.environ.get("VERBOSE", "").lower() in ("1", "true", "yes")
 
@@ -426,9 +1003,7 @@ def main():
     if verbose:
         logging.getLogger().setLevel(logging.DEBUG)
 
-    bot = CasinoBot(
-        api_url=api_url,
-        token=token,
+    bot_kwargs = dict(
         strategy_name=strategy,
         table_id=table,
         bet_size=bet_size,
@@ -436,9 +1011,15 @@ def main():
         max_rounds=max_rounds,
         min_balance=min_balance,
         poll_interval=poll_interval,
+        transport=transport,
         no_refill=no_refill,
         verbose=verbose,
     )
+    tokens = [t.strip() for t in token.split(",") if t.strip()]
+    if len(tokens) > 1:
+        bot = MultiBotRunner(api_url, tokens, **bot_kwargs)
+    else:
+        bot = CasinoBot(api_url=api_url, token=tokens[0] if tokens else token, **bot_kwargs)
 
     # Signal handling for graceful shutdown
     def signal_handler(sig, frame):
@@ -448,7 +1029,10 @@ def main():
     signal.signal(signal.SIGINT, signal_handler)
     signal.signal(signal.SIGTERM, signal_handler)
 
-    asyncio.run(bot.start())
+    if uvloop is not None:
+        uvloop.run(bot.start())
+    else:
+        asyncio.run(bot.start())
 
 
 if __name__ == "__main__":
@@ -7,44 +7,68 @@ Supports single strategy runs and comparison mode (--all).
 Usage:
     python simulator.py --strategy flat-red --rounds 1000
     python simulator.py --all --rounds 10000 --seed 42
+
+With NumPy installed (pip install numpy), strategies whose bets don't depend on
+results (flat-red, flat-dozen, james-bond, ...) are simulated in bulk, and with
+numba as well Martingale and Reverse Color run as compiled code, which makes
+runs of millions of rounds practical.
 """
 import argparse
+import os
 import random
-import sys
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
 from typing import Optional, List, Tuple
 
+try:
+    import numpy as np
+except ImportError:  # optional: without it every strategy uses the per-round loop
+    np = None
+
+try:
+    import _sim_core
+except ImportError:  # optional: needs numba (and numpy)
+    _sim_core = None
+
 from strategies import (
     get_strategy, BotState, STRATEGIES,
-    RED_NUMBERS, BLACK_NUMBERS, BaseStrategy,
+    RED_NUMBERS, BLACK_NUMBERS, BaseStrategy, MartingaleStrategy, ReverseColorStrategy,
 )
 
 
+# Lookup tables: color per pocket, and the winning pockets for each outside bet
+COLOR_BY_NUMBER = tuple(
+    "green" if n == 0 else ("red" if n in RED_NUMBERS else "black")
+    for n in range(37)
+)
+
+# Color codes per pocket for the numba kernels: 0 = green, 1 = red, 2 = black
+COLOR_CODES = (
+    np.array([("green", "red", "black").index(color) for color in COLOR_BY_NUMBER], dtype=np.int8)
+    if np is not None else None
+)
+
+WINNERS = {
+    "red": RED_NUMBERS,
+    "black": BLACK_NUMBERS,
+    "even": frozenset(range(2, 37, 2)),
+    "odd": frozenset(range(1, 37, 2)),
+    "dozen_1": frozenset(range(1, 13)),
+    "dozen_2": frozenset(range(13, 25)),
+    "dozen_3": frozenset(range(25, 37)),
+}
+
+
 def get_color(number: int) -> str:
     """Get the color of a roulette number."""
-    if number == 0:
-        return "green"
-    return "red" if number in RED_NUMBERS else "black"
+    return COLOR_BY_NUMBER[number]
 
 
 def check_win(bet_type: str, bet_value: Optional[int], result: int, color: str) -> bool:
     """Check if a bet wins."""
     if bet_type == "straight":
         return bet_value == result
-    elif bet_type == "red":
-        return color == "red"
-    elif bet_type == "black":
-        return color == "black"
-    elif bet_type == "even":
-        return result != 0 and result % 2 == 0
-    elif bet_type == "odd":
-        return result != 0 and result % 2 == 1
-    elif bet_type == "dozen_1":
-        return 1 <= result <= 12
-    elif bet_type == "dozen_2":
-        return 13 <= result <= 24
-    elif bet_type == "dozen_3":
-        return 25 <= result <= 36
-    return False
+    return result in WINNERS.get(bet_type, ())
 
 
 PAYOUT_MAP = {
@@ -58,16 +82,40 @@ PAYOUT_MAP = {
     "dozen_3": 2,
 }
 
+# Balance after an automatic refill
+REFILL_BALANCE = 1000
+
+# Spins drawn from NumPy per batch; 64 KiB of int8 pockets stays cache-resident
+SPIN_CHUNK = 65536
+
+
+def _spin_chunks(seed: int):
+    """Yield the wheel for a seed in fixed-size NumPy batches, so every engine sees the same spins."""
+    gen = np.random.default_rng(seed)
+    while True:
+        yield gen.integers(0, 37, size=SPIN_CHUNK, dtype=np.int8)
+
+
+def _wheel(seed: int):
+    """Yield spins one at a time, refilling from NumPy in batches when it is installed."""
+    if np is None:
+        rng = random.Random(seed)
+        while True:
+            yield rng.randint(0, 36)
+    for chunk in _spin_chunks(seed):
+        yield from chunk.tolist()
+
 
 def simulate_strategy(
     strategy: BaseStrategy,
     rounds: int,
     starting_balance: int,
-    rng: random.Random,
+    seed: int,
     no_refill: bool = False,
     verbose: bool = False,
 ) -> dict:
     """Run a simulation for a single strategy."""
+    spins = _wheel(seed)
     state = BotState(balance=starting_balance)
     peak_balance = starting_balance
     lowest_balance = starting_balance
@@ -82,7 +130,7 @@ def simulate_strategy(
                     print(f"  Round {i+1}: BANKRUPT - stopping")
                 break
             else:
-                state.balance = 1000
+                state.balance = REFILL_BALANCE
                 refills += 1
                 if verbose:
                     print(f"  Round {i+1}: REFILL -> {state.balance} BC")
@@ -92,7 +140,7 @@ def simulate_strategy(
         if decision is None:
             skipped += 1
             # Still spin the wheel
-            result = rng.randint(0, 36)
+            result = next(spins)
             color = get_color(result)
             state.update_after_round(result, color, False, 0, 0)
             strategy.on_result(result, color, False, state)
@@ -104,14 +152,14 @@ def simulate_strategy(
         amount = min(amount, state.balance)
         if amount <= 0:
             skipped += 1
-            result = rng.randint(0, 36)
+            result = next(spins)
             color = get_color(result)
             state.update_after_round(result, color, False, 0, 0)
             strategy.on_result(result, color, False, state)
             continue
 
         # Spin the wheel
-        result = rng.randint(0, 36)
+        result = next(spins)
         color = get_color(result)
 
         # Check win
@@ -162,6 +210,272 @@ def simulate_strategy(
     }
 
 
+def _longest_run(mask) -> int:
+    """Length of the longest run of True in a boolean array."""
+    if not mask.any():
+        return 0
+    edges = np.diff(np.concatenate(([0], mask.view(np.int8), [0])))
+    return int((np.flatnonzero(edges == -1) - np.flatnonzero(edges == 1)).max())
+
+
+def _win_table(bet_type: str, bet_value: Optional[int]):
+    """Whether the bet wins, indexed by pocket."""
+    win_table = np.zeros(37, dtype=bool)
+    win_table[[bet_value] if bet_type == "straight" else list(WINNERS[bet_type])] = True
+    return win_table
+
+
+def _spins(seed: int, rounds: int):
+    """Spin the wheel `rounds` times with NumPy."""
+    chunks = list(islice(_spin_chunks(seed), max(1, -(-rounds // SPIN_CHUNK))))
+    return np.concatenate(chunks)[:rounds]
+
+
+def _spin_wins(seed: int, rounds: int, bet_type: str, bet_value: Optional[int]):
+    """Spin the wheel `rounds` times with NumPy and return whether the bet wins on each spin."""
+    return _win_table(bet_type, bet_value)[_spins(seed, rounds)]
+
+
+def _planned_bets(strategy: BaseStrategy, seed: int, rounds: int):
+    """
+    Spin the wheel and lay out a batchable strategy's bets, one SPIN_CHUNK at a time.
+
+    Returns:
+        Arrays over rounds of (wins, amounts, win_deltas): whether the bet wins,
+        the full bet amount, and the net gain if it wins.
+    """
+    wins = np.empty(rounds, dtype=bool)
+    amounts = np.empty(rounds, dtype=np.int64)
+    win_deltas = np.empty(rounds, dtype=np.int64)
+    for start, spins in zip(range(0, rounds, SPIN_CHUNK), _spin_chunks(seed)):
+        n = min(SPIN_CHUNK, rounds - start)
+        spins = spins[:n]
+        bet_types, bet_values, chunk_amounts = strategy.decide_batch(n)
+        chunk_wins = wins[start:start + n]
+        chunk_deltas = win_deltas[start:start + n]
+        amounts[start:start + n] = chunk_amounts
+        for bet_type in np.unique(bet_types).tolist():
+            picked = bet_types == bet_type
+            if bet_type == "straight":
+                chunk_wins[picked] = spins[picked] == bet_values[picked]
+            else:
+                chunk_wins[picked] = _win_table(bet_type, None)[spins[picked]]
+            chunk_deltas[picked] = chunk_amounts[picked] * PAYOUT_MAP[bet_type]
+    return wins, amounts, win_deltas
+
+
+def simulate_strategy_vectorized(
+    strategy: BaseStrategy,
+    rounds: int,
+    starting_balance: int,
+    seed: int,
+    no_refill: bool = False,
+) -> dict:
+    """
+    Run a simulation for a batchable strategy with NumPy.
+
+    Stretches of affordable bets are settled in bulk with a cumulative sum; only
+    the rounds where the balance runs low (refill, all-in bet, skip or bankruptcy)
+    are handled individually. Spins come from the same NumPy wheel as
+    simulate_strategy(), so both give identical results for the same seed.
+    """
+    wins, amounts, win_deltas = _planned_bets(strategy, seed, rounds)
+    # Bets below one chip are skipped, as in the per-round loop: no stake, no win
+    unplaced = amounts < 1
+    has_unplaced = bool(unplaced.any())
+    if has_unplaced:
+        wins[unplaced] = False
+        amounts[unplaced] = 0
+        win_deltas[unplaced] = 0
+    deltas = np.where(wins, win_deltas, -amounts)
+    # Below bet_size decide() skips; below the amount the bet is clamped to the balance
+    full_bet_balance = np.maximum(amounts, strategy.bet_size)
+
+    balance = starting_balance
+    peak_balance = starting_balance
+    lowest_balance = starting_balance
+    refills = 0
+    skipped = 0
+    total_wagered = 0
+    total_won = 0
+    bets_won = 0
+    outcomes = []  # win flags per round; skipped rounds count as losses, as in BotState
+    i = 0
+
+    while i < rounds:
+        if balance <= 0:
+            if no_refill:
+                break
+            balance = REFILL_BALANCE
+            refills += 1
+
+        if balance < strategy.bet_size:
+            # Every bet is skipped and the balance can't change any more
+            skipped += rounds - i
+            outcomes.append(np.zeros(rounds - i, dtype=bool))
+            i = rounds
+            break
+
+        if balance < amounts[i]:
+            # All-in: the bet is clamped to what is left
+            amount = balance
+            won = bool(wins[i])
+            total_wagered += amount
+            if won:
+                gain = int(win_deltas[i]) * amount // int(amounts[i])
+                balance += gain
+                total_won += gain + amount
+                bets_won += 1
+            else:
+                balance = 0
+            peak_balance = max(peak_balance, balance)
+            lowest_balance = min(lowest_balance, balance)
+            outcomes.append(wins[i:i + 1])
+            i += 1
+            continue
+
+        # Settle bets in bulk up to the round that leaves too little for the next full bet
+        window = 4096
+        while True:
+            end = min(rounds, i + window)
+            balances = balance + np.cumsum(deltas[i:end])
+            broke = np.flatnonzero(balances[:-1] < full_bet_balance[i + 1:end])
+            if broke.size or end == rounds:
+                break
+            window *= 2
+
+        count = int(broke[0]) + 1 if broke.size else end - i
+        segment = wins[i:i + count]
+        balances = balances[:count]
+
+        peak_balance = max(peak_balance, int(balances.max()))
+        lowest_balance = min(lowest_balance, int(balances.min()))
+        total_wagered += int(amounts[i:i + count].sum())
+        total_won += int((win_deltas[i:i + count] + amounts[i:i + count])[segment].sum())
+        bets_won += int(segment.sum())
+        if has_unplaced:
+            skipped += int(unplaced[i:i + count].sum())
+        outcomes.append(segment)
+        balance = int(balances[-1])
+        i += count
+
+    rounds_played = i
+    outcomes = np.concatenate(outcomes) if outcomes else np.zeros(0, dtype=bool)
+    net_profit = total_won - total_wagered
+
+    return {
+        "strategy": strategy.name,
+        "rounds_played": rounds_played,
+        "final_balance": balance,
+        "net_profit": net_profit,
+        "total_wagered": total_wagered,
+        "total_won": total_won,
+        "win_rate": (bets_won / rounds_played) * 100 if rounds_played else 0.0,
+        "peak_balance": peak_balance,
+        "lowest_balance": lowest_balance,
+        "max_win_streak": _longest_run(outcomes),
+        "max_loss_streak": _longest_run(~outcomes),
+        "refills": refills,
+        "skipped": skipped,
+        "roi": (net_profit / total_wagered * 100) if total_wagered > 0 else 0,
+    }
+
+
+def simulate_martingale_compiled(
+    strategy: MartingaleStrategy,
+    rounds: int,
+    starting_balance: int,
+    seed: int,
+    no_refill: bool = False,
+) -> dict:
+    """Run a Martingale simulation through the numba kernel, on the same NumPy wheel as the vectorized path."""
+    wins = _spin_wins(seed, rounds, strategy.color, None)
+    return _compiled_result(strategy, _sim_core.run_martingale(
+        wins, strategy.base_bet, strategy.max_bet, starting_balance, REFILL_BALANCE, no_refill,
+    ))
+
+
+def simulate_reverse_color_compiled(
+    strategy: ReverseColorStrategy,
+    rounds: int,
+    starting_balance: int,
+    seed: int,
+    no_refill: bool = False,
+) -> dict:
+    """Run a Reverse Color simulation through the numba kernel, on the same NumPy wheel as the vectorized path."""
+    colors = COLOR_CODES[_spins(seed, rounds)]
+    return _compiled_result(strategy, _sim_core.run_reverse_color(
+        colors, strategy.bet_size, starting_balance, REFILL_BALANCE, no_refill,
+    ))
+
+
+def _compiled_result(strategy: BaseStrategy, stats: tuple) -> dict:
+    """Build a simulation result from a numba kernel's stats tuple."""
+    (
+        rounds_played, final_balance, total_wagered, total_won, rounds_won,
+        peak_balance, lowest_balance, max_win_streak, max_loss_streak, refills, skipped,
+    ) = stats
+    net_profit = total_won - total_wagered
+
+    return {
+        "strategy": strategy.name,
+        "rounds_played": rounds_played,
+        "final_balance": final_balance,
+        "net_profit": net_profit,
+        "total_wagered": total_wagered,
+        "total_won": total_won,
+        "win_rate": (rounds_won / rounds_played) * 100 if rounds_played else 0.0,
+        "peak_balance": peak_balance,
+        "lowest_balance": lowest_balance,
+        "max_win_streak": max_win_streak,
+        "max_loss_streak": max_loss_streak,
+        "refills": refills,
+        "skipped": skipped,
+        "roi": (net_profit / total_wagered * 100) if total_wagered > 0 else 0,
+    }
+
+
+def run_simulation(
+    strategy: BaseStrategy,
+    rounds: int,
+    starting_balance: int,
+    seed: int,
+    no_refill: bool = False,
+    verbose: bool = False,
+) -> dict:
+    """
+    Simulate a strategy with the fastest available engine.
+
+    Without --verbose, batchable strategies run in bulk with NumPy and Martingale
+    and Reverse Color run through numba kernels; everything else uses the
+    per-round loop.
+    """
+    if np is not None and strategy.batchable and not verbose:
+        return simulate_strategy_vectorized(strategy, rounds, starting_balance, seed, no_refill=no_refill)
+    if _sim_core is not None and type(strategy) is MartingaleStrategy and not verbose:
+        return simulate_martingale_compiled(strategy, rounds, starting_balance, seed, no_refill=no_refill)
+    if _sim_core is not None and type(strategy) is ReverseColorStrategy and not verbose:
+        return simulate_reverse_color_compiled(strategy, rounds, starting_balance, seed, no_refill=no_refill)
+    return simulate_strategy(
+        strategy, rounds, starting_balance, seed,
+        no_refill=no_refill, verbose=verbose,
+    )
+
+
+def _run_one(
+    name: str,
+    seed: int,
+    rounds: int,
+    starting_balance: int,
+    bet_size: int,
+    lucky_number: Optional[int],
+    no_refill: bool,
+) -> dict:
+    """Build and simulate one strategy by name (process pool entry point)."""
+    strategy = get_strategy(name, bet_size=bet_size, lucky_number=lucky_number)
+    return run_simulation(strategy, rounds, starting_balance, seed, no_refill=no_refill)
+
+
 def print_result(result: dict):
     """Print formatted simulation result."""
     print(f"\n{'=' * 50}")
@@ -242,24 +556,24 @@ def main():
     print(f"Random seed: {seed}")
 
     if args.all:
-        # Comparison mode - all strategies with shared seed
-        results = []
-        for name in STRATEGIES:
-            rng = random.Random(seed)
-            strategy = get_strategy(name, bet_size=args.bet_size, lucky_number=args.lucky_number)
-            result = simulate_strategy(
-                strategy, args.rounds, args.balance, rng,
-                no_refill=args.no_refill, verbose=False,
-            )
-            results.append(result)
+        # Comparison mode - all strategies with shared seed, one worker process each
+        run_args = [
+            (name, seed, args.rounds, args.balance, args.bet_size, args.lucky_number, args.no_refill)
+            for name in STRATEGIES
+        ]
+        workers = min(len(STRATEGIES), os.cpu_count() or 1)
+        if workers > 1:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                results = list(executor.map(_run_one, *zip(*run_args)))
+        else:
+            results = [_run_one(*a) for a in run_args]
 
         print_comparison(results)
     else:
         # Single strategy mode
-        rng = random.Random(seed)
         strategy = get_strategy(args.strategy, bet_size=args.bet_size, lucky_number=args.lucky_number)
-        result = simulate_strategy(
-            strategy, args.rounds, args.balance, rng,
+        result = run_simulation(
+            strategy, args.rounds, args.balance, seed,
             no_refill=args.no_refill, verbose=args.verbose,
         )
         print_result(result)
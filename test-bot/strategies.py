@@ -3,16 +3,24 @@ Betting strategies for the AI Bot Casino test bot.
 Each strategy implements decide() to choose a bet and optionally on_result() to adapt.
 """
 import random
+from collections import deque
 from abc import ABC, abstractmethod
+import inspect
 from dataclasses import dataclass, field
-from typing import Optional, Tuple, List
+from typing import Deque, Optional, Tuple
 
+try:
+    import numpy as np
+except ImportError:  # optional: only the simulator's bulk path uses decide_batch()
+    np = None
 
-RED_NUMBERS = {1, 3, 5, 7, 9, 12, 14, 16, 18, 19, 21, 23, 25, 27, 30, 32, 34, 36}
-BLACK_NUMBERS = {2, 4, 6, 8, 10, 11, 13, 15, 17, 20, 22, 24, 26, 28, 29, 31, 33, 35}
 
+RED_NUMBERS = frozenset({1, 3, 5, 7, 9, 12, 14, 16, 18, 19, 21, 23, 25, 27, 30, 32, 34, 36})
+BLACK_NUMBERS = frozenset({2, 4, 6, 8, 10, 11, 13, 15, 17, 20, 22, 24, 26, 28, 29, 31, 33, 35})
+_OPPOSITE_COLOR = {"red": "black", "black": "red"}
 
-@dataclass
+
+@dataclass(slots=True)
 class BotState:
     """Current bot state exposed to strategies."""
     balance: int = 1000
@@ -27,7 +35,7 @@ class BotState:
     max_consecutive_wins: int = 0
     last_result: Optional[int] = None
     last_color: Optional[str] = None
-    history: List[int] = field(default_factory=list)
+    history: Deque[int] = field(default_factory=lambda: deque(maxlen=100))  # most recent results
 
     @property
     def win_rate(self) -> float:
@@ -43,14 +51,14 @@ class BotState:
         """Update state after a round completes."""
         self.rounds_played += 1
         self.total_wagered += wagered
+        self.total_won += payout  # zero on a loss
         self.last_result = result_number
         self.last_color = result_color
         self.history.append(result_number)
-        if len(self.history) > 100:
-            self.history = self.history[-100:]
 
+        # A predictable branch per outcome is cheaper in CPython than arithmetic
+        # streak updates with max()
         if won:
-            self.total_won += payout
             self.wins += 1
             self.consecutive_wins += 1
             self.consecutive_losses = 0
@@ -69,12 +77,17 @@ class BaseStrategy(ABC):
 
     name: str = "base"
     description: str = ""
+    # Batchable strategies' bets don't depend on results, so they implement
+    # decide_batch() and the simulator can evaluate them in bulk
+    batchable: bool = False
 
     @abstractmethod
     def decide(self, state: BotState) -> Optional[Tuple[str, Optional[int], int]]:
         """
         Decide what bet to place.
 
+        The returned tuple may be shared between calls; callers must not mutate it.
+
         Returns:
             Tuple of (bet_type, bet_value, amount) or None to skip this round.
             bet_type: "straight", "red", "black", "even", "odd", "dozen_1", "dozen_2", "dozen_3"
@@ -83,92 +96,153 @@ class BaseStrategy(ABC):
         """
         pass
 
+    def decide_batch(self, n: int):
+        """
+        Decide the next n bets at once. Only batchable strategies implement this.
+
+        Each bet is what decide() would return with an ample balance; decide()
+        must skip (without advancing) when balance < bet_size, and amounts are
+        clamped to the balance by the caller.
+
+        Returns:
+            Tuple of NumPy arrays (bet_types, bet_values, amounts), each of length n.
+            bet_values is -1 for all but straight bets.
+        """
+        raise NotImplementedError(f"{self.name} decides one round at a time")
+
     def on_result(self, number: int, color: str, won: bool, state: BotState):
         """Called after each round. Override for stateful strategies."""
         pass
 
 
+def _flat_batch(n: int, bet_type: str, bet_value: int, amount: int):
+    """Bet arrays for n identical bets."""
+    return np.full(n, bet_type), np.full(n, bet_value), np.full(n, amount, dtype=np.int64)
+
+
+def _rotation_batch(n: int, phase: int, decisions: Tuple[Tuple[str, Optional[int], int], ...]):
+    """Bet arrays for n rounds cycling through `decisions`, starting at index `phase`."""
+    steps = np.arange(phase, phase + n) % len(decisions)
+    bet_types, bet_values, amounts = zip(*decisions)
+    return (
+        np.array(bet_types)[steps],
+        np.array([-1 if value is None else value for value in bet_values])[steps],
+        np.array(amounts, dtype=np.int64)[steps],
+    )
+
+
 class FlatRedStrategy(BaseStrategy):
     name = "flat-red"
     description = "Always bet on red with fixed amount"
+    batchable = True
 
     def __init__(self, bet_size: int = 10):
         self.bet_size = bet_size
+        self._decision = ("red", None, bet_size)
 
     def decide(self, state: BotState) -> Optional[Tuple[str, Optional[int], int]]:
         if state.balance < self.bet_size:
             return None
-        return ("red", None, self.bet_size)
+        return self._decision
+
+    def decide_batch(self, n: int):
+        return _flat_batch(n, "red", -1, self.bet_size)
 
 
 class FlatBlackStrategy(BaseStrategy):
     name = "flat-black"
     description = "Always bet on black with fixed amount"
+    batchable = True
 
     def __init__(self, bet_size: int = 10):
         self.bet_size = bet_size
+        self._decision = ("black", None, bet_size)
 
     def decide(self, state: BotState) -> Optional[Tuple[str, Optional[int], int]]:
         if state.balance < self.bet_size:
             return None
-        return ("black", None, self.bet_size)
+        return self._decision
+
+    def decide_batch(self, n: int):
+        return _flat_batch(n, "black", -1, self.bet_size)
 
 
 class FlatEvenStrategy(BaseStrategy):
     name = "flat-even"
     description = "Always bet on even with fixed amount"
+    batchable = True
 
     def __init__(self, bet_size: int = 10):
         self.bet_size = bet_size
+        self._decision = ("even", None, bet_size)
 
     def decide(self, state: BotState) -> Optional[Tuple[str, Optional[int], int]]:
         if state.balance < self.bet_size:
             return None
-        return ("even", None, self.bet_size)
+        return self._decision
+
+    def decide_batch(self, n: int):
+        return _flat_batch(n, "even", -1, self.bet_size)
 
 
 class FlatOddStrategy(BaseStrategy):
     name = "flat-odd"
     description = "Always bet on odd with fixed amount"
+    batchable = True
 
     def __init__(self, bet_size: int = 10):
         self.bet_size = bet_size
+        self._decision = ("odd", None, bet_size)
 
     def decide(self, state: BotState) -> Optional[Tuple[str, Optional[int], int]]:
         if state.balance < self.bet_size:
             return None
-        return ("odd", None, self.bet_size)
+        return self._decision
+
+    def decide_batch(self, n: int):
+        return _flat_batch(n, "odd", -1, self.bet_size)
 
 
 class FlatDozenStrategy(BaseStrategy):
     name = "flat-dozen"
     description = "Rotate through 1st, 2nd, 3rd dozen"
+    batchable = True
 
     def __init__(self, bet_size: int = 10):
         self.bet_size = bet_size
-        self._round = 0
+        self._phase = 0  # index of the next decision
+        self._decisions = (("dozen_1", None, bet_size), ("dozen_2", None, bet_size), ("dozen_3", None, bet_size))
 
     def decide(self, state: BotState) -> Optional[Tuple[str, Optional[int], int]]:
         if state.balance < self.bet_size:
             return None
-        dozens = ["dozen_1", "dozen_2", "dozen_3"]
-        bet_type = dozens[self._round % 3]
-        self._round += 1
-        return (bet_type, None, self.bet_size)
+        decision = self._decisions[self._phase]
+        self._phase = 0 if self._phase == 2 else self._phase + 1
+        return decision
+
+    def decide_batch(self, n: int):
+        batch = _rotation_batch(n, self._phase, self._decisions)
+        self._phase = (self._phase + n) % 3
+        return batch
 
 
 class FlatNumberStrategy(BaseStrategy):
     name = "flat-number"
     description = "Always bet on a single lucky number"
+    batchable = True
 
     def __init__(self, bet_size: int = 10, lucky_number: int = None):
         self.bet_size = bet_size
         self.lucky_number = lucky_number if lucky_number is not None else random.randint(0, 36)
+        self._decision = ("straight", self.lucky_number, bet_size)
 
     def decide(self, state: BotState) -> Optional[Tuple[str, Optional[int], int]]:
         if state.balance < self.bet_size:
             return None
-        return ("straight", self.lucky_number, self.bet_size)
+        return self._decision
+
+    def decide_batch(self, n: int):
+        return _flat_batch(n, "straight", self.lucky_number, self.bet_size)
 
 
 class MartingaleStrategy(BaseStrategy):
@@ -178,21 +252,32 @@ class MartingaleStrategy(BaseStrategy):
     def __init__(self, bet_size: int = 10, max_bet: int = 500, color: str = "red"):
         self.base_bet = bet_size
         self.max_bet = max_bet
-        self.current_bet = bet_size
         self.color = color
+        # Bet after k consecutive losses: the base bet doubled k times, capped at
+        # max_bet. The streak is tracked by BotState, so there is no on_result().
+        # A base bet below 1 never doubles into a real bet, so the schedule stays
+        # empty and every round is skipped
+        schedule = []
+        if bet_size >= 1:
+            bet = bet_size
+            while bet < max_bet:
+                schedule.append(bet)
+                bet *= 2
+            schedule.append(max_bet)
+        self._schedule = tuple(schedule)
+        self._last_step = len(schedule) - 1
 
     def decide(self, state: BotState) -> Optional[Tuple[str, Optional[int], int]]:
-        bet = min(self.current_bet, state.balance, self.max_bet)
+        if not self._schedule:
+            return None
+        step = state.consecutive_losses
+        bet = self._schedule[step if step < self._last_step else self._last_step]
+        if bet > state.balance:
+            bet = state.balance
         if bet < 1:
             return None
         return (self.color, None, bet)
 
-    def on_result(self, number: int, color: str, won: bool, state: BotState):
-        if won:
-            self.current_bet = self.base_bet
-        else:
-            self.current_bet = min(self.current_bet * 2, self.max_bet)
-
 
 class ReverseColorStrategy(BaseStrategy):
     name = "reverse-color"
@@ -201,66 +286,64 @@ class ReverseColorStrategy(BaseStrategy):
     def __init__(self, bet_size: int = 10):
         self.bet_size = bet_size
         self.next_color = "red"  # start with red
+        self._decisions = {color: (color, None, bet_size) for color in ("red", "black")}
 
     def decide(self, state: BotState) -> Optional[Tuple[str, Optional[int], int]]:
         if state.balance < self.bet_size:
             return None
-        return (self.next_color, None, self.bet_size)
+        return self._decisions[self.next_color]
 
     def on_result(self, number: int, color: str, won: bool, state: BotState):
-        if color == "red":
-            self.next_color = "black"
-        elif color == "black":
-            self.next_color = "red"
         # On green, keep current bet
+        self.next_color = _OPPOSITE_COLOR.get(color, self.next_color)
 
 
 class ZeroHunterStrategy(BaseStrategy):
     name = "zero-hunter"
     description = "Always bet on zero (35:1 payout)"
+    batchable = True
 
     def __init__(self, bet_size: int = 10):
         self.bet_size = bet_size
+        self._decision = ("straight", 0, bet_size)
 
     def decide(self, state: BotState) -> Optional[Tuple[str, Optional[int], int]]:
         if state.balance < self.bet_size:
             return None
-        return ("straight", 0, self.bet_size)
+        return self._decision
+
+    def decide_batch(self, n: int):
+        return _flat_batch(n, "straight", 0, self.bet_size)
 
 
 class JamesBondStrategy(BaseStrategy):
     name = "james-bond"
     description = "Rotate: 50% 3rd dozen, 35% 2nd dozen, 15% zero"
+    batchable = True
 
     def __init__(self, bet_size: int = 10):
         self.bet_size = bet_size
-        self._round = 0
+        self._phase = 0  # index of the next decision
+        self._decisions = (
+            ("dozen_3", None, max(1, int(bet_size * 1.5))),  # 50% on 3rd dozen
+            ("dozen_2", None, max(1, int(bet_size * 1.0))),  # 35% on 2nd dozen
+            ("straight", 0, max(1, int(bet_size * 0.5))),    # 15% on zero
+        )
 
     def decide(self, state: BotState) -> Optional[Tuple[str, Optional[int], int]]:
         if state.balance < self.bet_size:
             return None
 
-        phase = self._round % 3
-        self._round += 1
-
-        if phase == 0:
-            # 50% on 3rd dozen
-            amount = max(1, int(self.bet_size * 1.5))
-            if amount > state.balance:
-                amount = state.balance
-            return ("dozen_3", None, amount)
-        elif phase == 1:
-            # 35% on 2nd dozen
-            amount = max(1, int(self.bet_size * 1.0))
-            if amount > state.balance:
-                amount = state.balance
-            return ("dozen_2", None, amount)
-        else:
-            # 15% on zero
-            amount = max(1, int(self.bet_size * 0.5))
-            if amount > state.balance:
-                amount = state.balance
-            return ("straight", 0, amount)
+        decision = self._decisions[self._phase]
+        self._phase = 0 if self._phase == 2 else self._phase + 1
+        if decision[2] > state.balance:
+            return (decision[0], decision[1], state.balance)
+        return decision
+
+    def decide_batch(self, n: int):
+        batch = _rotation_batch(n, self._phase, self._decisions)
+        self._phase = (self._phase + n) % 3
+        return batch
 
 
 class RandomStrategy(BaseStrategy):
@@ -281,15 +364,21 @@ class RandomStrategy(BaseStrategy):
             ZeroHunterStrategy(bet_size),
             JamesBondStrategy(bet_size),
         ]
+        # Own generator: picks don't contend on the module-level one shared across threads
+        self._rng = random.Random()
+        self._decide_funcs = tuple(s.decide for s in self.sub_strategies)
+        # Only strategies that override on_result() need to hear about results
+        self._result_listeners = tuple(
+            s.on_result for s in self.sub_strategies if type(s).on_result is not BaseStrategy.on_result
+        )
 
     def decide(self, state: BotState) -> Optional[Tuple[str, Optional[int], int]]:
-        strategy = random.choice(self.sub_strategies)
-        return strategy.decide(state)
+        return self._rng.choice(self._decide_funcs)(state)
 
     def on_result(self, number: int, color: str, won: bool, state: BotState):
-        # Notify all sub-strategies so stateful ones stay updated
-        for s in self.sub_strategies:
-            s.on_result(number, color, won, state)
+        # Notify every stateful sub-strategy, not just the one that bet, so they stay updated
+        for on_result in self._result_listeners:
+            on_result(number, color, won, state)
 
 
 # Strategy registry
@@ -308,21 +397,20 @@ STRATEGIES = {
 }
 
 
+def _factory(cls):
+    """Constructor for a registered strategy, forwarding lucky_number only to those that take it."""
+    if "lucky_number" in inspect.signature(cls).parameters:
+        return lambda bet_size, lucky_number: cls(bet_size=bet_size, lucky_number=lucky_number)
+    return lambda bet_size, lucky_number: cls(bet_size=bet_size)
+
+
+# Strategy constructors keyed by name, built once from the registry
+_FACTORIES = {name: _factory(cls) for name, cls in STRATEGIES.items()}
+
+
 def get_strategy(name: str, bet_size: int = 10, lucky_number: int = None) -> BaseStrategy:
     """Create a strategy instance by name."""
-    if name not in STRATEGIES:
-        raise ValueError(f"Unknown strategy: {name}. Available: {', '.join(STRATEGIES.keys())}")
-
-    cls = STRATEGIES[name]
-
-    # Pass appropriate kwargs based on strategy
-    if name == "flat-number":
-        return cls(bet_size=bet_size, lucky_number=lucky_number)
-    elif name == "martingale":
-        return cls(bet_size=bet_size)
-    elif name == "random":
-        return cls(bet_size=bet_size, lucky_number=lucky_number)
-    elif name == "james-bond":
-        return cls(bet_size=bet_size)
-    else:
-        return cls(bet_size=bet_size)
+    factory = _FACTORIES.get(name)
+    if factory is None:
+        raise ValueError(f"Unknown strategy: {name}. Available: {', '.join(_FACTORIES)}")
+    return factory(bet_size, lucky_number)
@@ -0,0 +1,32 @@
+import pytest
+
+from simulator import run_simulation, simulate_strategy
+from strategies import BotState, get_strategy
+
+
+@pytest.mark.parametrize("bet_size", [0, -5])
+def test_martingale_below_one_chip_skips_every_round(bet_size):
+    assert get_strategy("martingale", bet_size=bet_size).decide(BotState(balance=1000)) is None
+
+    scalar = simulate_strategy(get_strategy("martingale", bet_size=bet_size), 500, 1000, seed=7)
+    fastest = run_simulation(get_strategy("martingale", bet_size=bet_size), 500, 1000, seed=7)
+    assert scalar == fastest
+    assert scalar["total_wagered"] == 0
+    assert scalar["skipped"] == 500
+
+
+@pytest.mark.parametrize("name", ["flat-red", "flat-dozen", "flat-number", "zero-hunter"])
+@pytest.mark.parametrize("bet_size", [0, -3])
+def test_vectorized_counts_bets_below_one_chip_as_skipped(name, bet_size):
+    scalar = simulate_strategy(get_strategy(name, bet_size=bet_size, lucky_number=5), 50, 1000, seed=3)
+    fastest = run_simulation(get_strategy(name, bet_size=bet_size, lucky_number=5), 50, 1000, seed=3)
+    assert scalar == fastest
+    assert fastest["skipped"] == 50
+
+
+@pytest.mark.parametrize("bet_size", [0, -3])
+def test_reverse_color_below_one_chip_matches_scalar(bet_size):
+    scalar = simulate_strategy(get_strategy("reverse-color", bet_size=bet_size), 200, 1000, seed=3)
+    fastest = run_simulation(get_strategy("reverse-color", bet_size=bet_size), 200, 1000, seed=3)
+    assert scalar == fastest
+    assert fastest["skipped"] == 200